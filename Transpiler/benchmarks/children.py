@@ -0,0 +1,36 @@
+"""Benchmark of editing the children of a layer with many children
+
+Run from the Transpiler directory with `python -m benchmarks.children`
+"""
+
+from time import perf_counter
+
+from transpiler.PC import Component, Layer
+
+
+def main() -> None:
+    """Times adding, comparing and removing the children of a layer"""
+    for count in (2000, 4000, 8000, 16000):
+        component = Component("Grid")
+        layer = Layer("$grid")
+        layer.is_root = True
+        component.add_layer(layer)
+        cells = [f"cell {index}" for index in range(count)]
+
+        start = perf_counter()
+        for cell in cells:
+            layer.add_child(cell)
+        for _ in range(100):
+            # pylint: disable=[comparison-with-itself]
+            assert layer == layer
+        # The last children are the furthest from the start of the list
+        for cell in reversed(cells):
+            layer.remove_child(cell)
+        elapsed = perf_counter() - start
+        print(
+            f"{count:>6} children: {elapsed:8.3f}s {elapsed / count * 1e6:7.2f}us/child"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark of building the component dependency graph and its topological levels
+
+Run from the Transpiler directory with `python -m benchmarks.dependency_graph`
+"""
+
+import gc
+from time import perf_counter
+
+from transpiler.PC import Identifier
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+
+
+def main() -> None:
+    """Times DSL.dependency_graph and DependencyGraph.levels on documents of increasing size"""
+    for components in (1000, 2000, 4000, 8000):
+        dsl = decode(generate(components=components, layers=4), backend="descent")
+        # Every component imports the two components after it
+        for index, component in enumerate(dsl.components):
+            for offset, layer in enumerate(component.layers[1:3], start=1):
+                if index + offset < components:
+                    layer.import_library = "custom"
+                    layer.import_name = Identifier.of(f"Component{index + offset}")
+
+        # Like timeit, keep collections of the large document out of the timing
+        gc.disable()
+        start = perf_counter()
+        levels = dsl.dependency_graph().levels()
+        elapsed = perf_counter() - start
+        gc.enable()
+        print(
+            f"{components:>5} components, {len(levels):>5} levels: "
+            f"{elapsed * 1e3:8.2f}ms {elapsed / components * 1e6:6.2f}us/component"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark of serializing documents with encode and encode_to
+
+Run from the Transpiler directory with `python -m benchmarks.encode`
+"""
+
+import os
+import tracemalloc
+from time import perf_counter
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+from transpiler.PC.encoder import encode, encode_to
+
+
+def main() -> None:
+    """Times encode and encode_to, and measures their peak memory, on components of increasing size"""
+    for layers in (2500, 5000, 10000, 20000):
+        dsl = decode(generate(layers=layers, children=4), backend="descent")
+
+        tracemalloc.start()
+        start = perf_counter()
+        encode(dsl)
+        string_time = perf_counter() - start
+        _, string_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        with open(os.devnull, "w", encoding="utf-8") as stream:
+            tracemalloc.start()
+            start = perf_counter()
+            encode_to(dsl, stream)
+            stream_time = perf_counter() - start
+            _, stream_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(
+            f"{layers:>6} layers: encode {string_time:7.3f}s {string_peak / 2**20:7.1f}MiB, "
+            f"encode_to {stream_time:7.3f}s {stream_peak / 2**20:7.1f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
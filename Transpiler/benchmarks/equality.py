@@ -0,0 +1,44 @@
+"""Benchmark of comparisons of decoded documents against cached ones
+
+Run from the Transpiler directory with `python -m benchmarks.equality`
+"""
+
+from time import perf_counter
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+
+
+def main() -> None:
+    """
+    Times the digest of a decoded document, then == of it against a cached
+    equal document, and against a cached document differing in one layer
+    """
+    for layers in (2500, 5000, 10000, 20000):
+        text = generate(layers=layers, children=4)
+        cached = decode(text, backend="descent")
+        different = decode(text, backend="descent")
+        different.components[-1].layers[-1].props = {"changed": True}
+        cached.digest, different.digest  # pylint: disable=[pointless-statement]
+        decoded = decode(text, backend="descent")
+
+        start = perf_counter()
+        decoded.digest  # pylint: disable=[pointless-statement]
+        hashing = perf_counter() - start
+
+        start = perf_counter()
+        assert decoded == cached
+        equal = perf_counter() - start
+
+        start = perf_counter()
+        assert decoded != different
+        mismatch = perf_counter() - start
+
+        print(
+            f"{layers:>6} layers: digest {hashing:7.3f}s, "
+            f"equal {equal * 1e3:8.3f}ms, different {mismatch * 1e3:8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark of re-validating documents after interactive edits
+
+Run from the Transpiler directory with `python -m benchmarks.incremental`
+"""
+
+from time import perf_counter
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+from transpiler.PC.encoder import validate, validate_incremental
+
+
+def main() -> None:
+    """Times validate and validate_incremental after editing a layer of 50k-layer documents"""
+    for components, layers in ((1, 50000), (50, 1000)):
+        dsl = decode(
+            generate(components=components, layers=layers - 1), backend="descent"
+        )
+        validate_incremental(dsl)
+        layer = dsl.components[components // 2].layers[layers // 2]
+
+        full = incremental = float("inf")
+        for index in range(100):
+            layer.props = {"index": index}
+            start = perf_counter()
+            validate(dsl)
+            full = min(full, perf_counter() - start)
+
+            layer.add_child(f"edit {index}")
+            start = perf_counter()
+            validate_incremental(dsl)
+            incremental = min(incremental, perf_counter() - start)
+
+        print(
+            f"{components:>3} x {layers:>6} layers: "
+            f"validate {full * 1e3:8.3f}ms validate_incremental {incremental * 1e3:8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Benchmark of walking the parse tree of components with many layers
+
+Run from the Transpiler directory with `python -m benchmarks.layer_index`
+"""
+
+from time import perf_counter
+
+from antlr4 import InputStream, CommonTokenStream, PredictionMode
+
+from transpiler.PC.decoder.corpus import generate
+from transpiler.PC.decoder.lib import PCLexer, PCParser
+from transpiler.PC.decoder.visitor import Visitor
+
+
+def main() -> None:
+    """Times Visitor.walk on single components of increasing size"""
+    for layers in (1250, 2500, 5000, 10000):
+        parser = PCParser(
+            CommonTokenStream(PCLexer(InputStream(generate(layers=layers))))
+        )
+        # pylint: disable=[protected-access]
+        parser._interp.predictionMode = PredictionMode.SLL
+        tree = parser.dsl()
+
+        start = perf_counter()
+        Visitor(tree=tree).walk()
+        elapsed = perf_counter() - start
+        print(
+            f"{layers:>6} layers: {elapsed:8.3f}s {elapsed / layers * 1e6:8.1f}us/layer"
+        )
+
+
+if __name__ == "__main__":
+    main()
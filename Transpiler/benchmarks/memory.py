@@ -0,0 +1,92 @@
+"""Benchmark of the memory held by decoded documents
+
+Run from the Transpiler directory with `python -m benchmarks.memory`
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List, Type
+
+from transpiler.PC import Component, Identifier, Layer, PropReference
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+
+# The classes that declare their attributes in __slots__
+slotted = (Identifier, PropReference, Layer, Component)
+
+# Classes with the same attributes, kept in a per-instance __dict__ as before
+unslotted: Dict[Type, Type] = {cls: type(cls.__name__, (), {}) for cls in slotted}
+
+
+def attributes(cls: Type) -> List[str]:
+    """The attributes a class declares in __slots__, in order"""
+    return [
+        name
+        for base in reversed(cls.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name != "__weakref__"
+    ]
+
+
+def slotted_objects(root: Any) -> List[Any]:
+    """The instances of the slotted classes reachable from an object"""
+    found, seen, stack = [], {id(root)}, [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, slotted):
+            found.append(obj)
+        for referent in gc.get_referents(obj):
+            if id(referent) not in seen and not isinstance(referent, type):
+                seen.add(id(referent))
+                stack.append(referent)
+    return found
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    """The bytes allocated for the objects a function returns"""
+    tracemalloc.start()
+    built = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def copies(objects: List[Any], classes: Callable[[Type], Type]) -> List[Any]:
+    """Copies of objects with the same attribute values, as instances of other classes"""
+    result = [None] * len(objects)
+    for position, obj in enumerate(objects):
+        cls = type(obj)
+        copy = object.__new__(classes(cls))
+        for name in attributes(cls):
+            object.__setattr__(copy, name, object.__getattribute__(obj, name))
+        result[position] = copy
+    return result
+
+
+def main() -> None:
+    """Measures the memory allocated for decoded DSL objects, per layer, against
+    the same objects with their attributes in a __dict__"""
+    for layers in (1000, 10000):
+        document = generate(layers=layers)
+        tracemalloc.start()
+        dsl = decode(document, backend="descent")
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Swaps the slotted objects for __dict__ ones holding the same values
+        objects = slotted_objects(dsl)
+        with_slots = allocated(lambda: copies(objects, lambda cls: cls))
+        with_dict = allocated(lambda: copies(objects, unslotted.__getitem__))
+        baseline = size - with_slots + with_dict
+        print(
+            f"{layers:>6} layers: "
+            f"__dict__ {baseline / (layers + 1):8.1f} bytes/layer "
+            f"__slots__ {size / (layers + 1):8.1f} bytes/layer "
+            f"({1 - size / baseline:5.1%} less)"
+        )
+        del dsl, objects
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark of the memory held by versions of a document
+
+Run from the Transpiler directory with `python -m benchmarks.snapshots`
+"""
+
+import random
+import tracemalloc
+from copy import deepcopy
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+
+
+def main() -> None:
+    """
+    Measures the memory allocated for versions of a document each editing the
+    props of one layer, kept as evolved snapshots and as deep copies
+    """
+    rng = random.Random(0)
+    for layers, versions in ((1000, 1000), (10000, 1000)):
+        dsl = decode(generate(layers=layers), backend="descent")
+        component = dsl.components[0].identifier
+        identifiers = [layer.identifier for layer in dsl.components[0].layers]
+
+        tracemalloc.start()
+        snapshots = [dsl.freeze()]
+        base, _ = tracemalloc.get_traced_memory()
+        for version in range(versions):
+            snapshots.append(
+                snapshots[-1].evolve_layer(
+                    component, rng.choice(identifiers), props={"version": version}
+                )
+            )
+        evolved, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del snapshots
+
+        # Deep copies take as much memory each, a few are enough to measure it
+        copies = min(versions, 3)
+        tracemalloc.start()
+        kept = []
+        for version in range(copies):
+            copy = deepcopy(dsl)
+            copy.get_component(component).get_layer(rng.choice(identifiers)).props = {
+                "version": version
+            }
+            kept.append(copy)
+        copied, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+
+        print(
+            f"{layers:>6} layers, {versions:>5} versions: snapshot {base / 2**20:6.1f}MiB, "
+            f"evolved {(evolved - base) / versions / 1024:6.1f}KiB/version, "
+            f"deep copies {copied / copies / 1024:8.1f}KiB/version"
+        )
+
+
+if __name__ == "__main__":
+    main()
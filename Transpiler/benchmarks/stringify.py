@@ -0,0 +1,32 @@
+"""Benchmark of str() and repr() of documents
+
+Run from the Transpiler directory with `python -m benchmarks.stringify`
+"""
+
+from time import perf_counter
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+
+
+def main() -> None:
+    """Times str() and repr() of components of increasing size"""
+    for layers in (2500, 5000, 10000, 20000):
+        dsl = decode(generate(layers=layers, children=4), backend="descent")
+
+        start = perf_counter()
+        str(dsl)
+        pretty = perf_counter() - start
+
+        start = perf_counter()
+        repr(dsl)
+        compact = perf_counter() - start
+
+        print(
+            f"{layers:>6} layers: str {pretty:7.3f}s {pretty / layers * 1e6:6.1f}us/layer, "
+            f"repr {compact:7.3f}s {compact / layers * 1e6:6.1f}us/layer"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark of comparisons of layers with large list props
+
+Run from the Transpiler directory with `python -m benchmarks.value_comparison`
+"""
+
+from time import perf_counter
+
+from transpiler.PC.layer import Layer
+
+
+def table(rows: int, reverse: bool = False) -> Layer:
+    """
+    A layer with a prop holding a table of rows
+
+    Args:
+        rows (int): The number of rows
+        reverse (bool, optional): Whether the rows are in reverse order. Defaults to False.
+
+    Returns:
+        Layer: The layer
+    """
+    layer = Layer("$table")
+    order = range(rows - 1, -1, -1) if reverse else range(rows)
+    layer.props = {
+        "rows": [
+            {"id": row, "cells": [f"cell {row}", row * 0.5, True]} for row in order
+        ]
+    }
+    return layer
+
+
+def main() -> None:
+    """Times == of layers with tables of increasing size, with rows in the same and reverse order"""
+    for rows in (1000, 2000, 4000, 8000):
+        a, same, reverse = table(rows), table(rows), table(rows, reverse=True)
+
+        start = perf_counter()
+        assert a == same
+        ordered = perf_counter() - start
+
+        start = perf_counter()
+        assert a == reverse
+        unordered = perf_counter() - start
+
+        print(
+            f"{rows:>6} rows: same order {ordered:7.3f}s, reverse order {unordered:7.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
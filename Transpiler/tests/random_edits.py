@@ -0,0 +1,161 @@
+"""Random edits of DSL objects through their public API, shared by the property tests"""
+
+from random import Random
+from typing import Iterator
+
+from transpiler.PC import DSL, Component, Layer, Identifier, PropReference
+from transpiler.PC.errors import (
+    InvalidTransactionError,
+    IdentifierNotFoundError,
+    DuplicateIdentifierError,
+)
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import documents
+
+component_names = ["A", "B", "C", "D"]
+layer_names = ["$a", "$b", "$c", "$d", "$e"]
+prop_names = ["p", "q", "r"]
+
+# The seeds of the parametrized property tests
+seeds = range(20)
+
+# The errors of edits the DSL rejects, which leave it unchanged
+rejected_edit_errors = (
+    InvalidTransactionError,
+    IdentifierNotFoundError,
+    DuplicateIdentifierError,
+    ValueError,
+)
+
+
+def random_dsl(rng: Random) -> DSL:
+    """A DSL object to be edited: empty, or a decoded corpus document"""
+    if rng.random() < 0.3:
+        return decode(rng.choice(documents), backend="descent")
+    return DSL()
+
+
+def random_edit(dsl: DSL, rng: Random) -> None:
+    """Applies a random edit to a DSL object, ignoring the edits it rejects"""
+    try:
+        _random_edit(dsl, rng)
+    except rejected_edit_errors:
+        pass
+
+
+def edited_dsls(
+    seed: int, runs: int = 10, edits: int = 40
+) -> Iterator[tuple[DSL, Random]]:
+    """
+    Yields DSL objects after each of their random edits, with the random
+    generator of the run for the checks that pick among options
+    """
+    rng = Random(seed)
+    for _ in range(runs):
+        dsl = random_dsl(rng)
+        for _ in range(edits):
+            random_edit(dsl, rng)
+            yield dsl, rng
+
+
+def violation_keys(violations: list) -> list[tuple[str, str]]:
+    """The codes and messages of violations, in a comparable order"""
+    return sorted((violation.code, violation.message) for violation in violations)
+
+
+def _identifier(rng: Random, names: list[str]) -> Identifier:
+    return Identifier.of(rng.choice(names))
+
+
+def _random_edit(dsl: DSL, rng: Random) -> None:
+    kind = rng.randrange(19)
+    components = dsl.components
+    if kind == 0 or not components:
+        component = Component(rng.choice(component_names))
+        for prop in rng.sample(prop_names, rng.randrange(3)):
+            component.add_prop(Identifier.of(prop))
+        layer = Layer("$a")
+        layer.is_root = True
+        layer.import_library = "mui"
+        layer.import_name = Identifier.of("Box")
+        component.add_layer(layer)
+        dsl.add_component(component)
+        return
+    component = rng.choice(components)
+    layers = component.layers
+    layer = rng.choice(layers) if layers else None
+    if kind == 1:
+        dsl.delete_component(component.identifier)
+    elif kind == 2:
+        component.add_prop(_identifier(rng, prop_names))
+    elif kind == 3:
+        component.delete_prop(_identifier(rng, prop_names))
+    elif kind == 15:
+        # In place, as a set
+        if rng.random() < 0.5:
+            component.props.add(_identifier(rng, prop_names))
+        else:
+            component.props.discard(_identifier(rng, prop_names))
+    elif kind == 4:
+        added = Layer(rng.choice(layer_names))
+        added.import_library = "mui"
+        added.import_name = Identifier.of("Box")
+        component.add_layer(added)
+        if layers and rng.random() < 0.7:
+            added.parent = rng.choice(layers).identifier
+    elif kind == 5:
+        component.delete_layer(_identifier(rng, layer_names))
+    elif layer is None:
+        return
+    elif kind == 6:
+        layer.is_root = rng.random() < 0.5
+    elif kind == 7:
+        layer.parent = _identifier(rng, layer_names)
+    elif kind == 8:
+        layer.delete_parent()
+    elif kind == 9:
+        layer.add_child(
+            rng.choice(
+                [
+                    _identifier(rng, layer_names),
+                    "text",
+                    PropReference(_identifier(rng, prop_names)),
+                ]
+            )
+        )
+    elif kind == 10:
+        if layer.children:
+            layer.remove_child(rng.choice(layer.children))
+    elif kind == 11:
+        layer.import_library = rng.choice(["mui", "custom", None])
+    elif kind == 12:
+        layer.import_name = rng.choice(
+            [_identifier(rng, component_names), Identifier.of("Box"), None]
+        )
+    elif kind == 13:
+        layer.props = {
+            prop: PropReference(Identifier.of(prop))
+            for prop in rng.sample(prop_names, rng.randrange(3))
+        }
+    elif kind == 14:
+        layer.props = {"x": {"y": PropReference(_identifier(rng, prop_names))}}
+    elif kind == 16:
+        # In place, as a dict
+        layer.props[rng.choice(prop_names)] = PropReference(
+            _identifier(rng, prop_names)
+        )
+    elif kind == 17:
+        # In place, in a nested dict or list
+        nested = layer.props.get("x")
+        if isinstance(nested, dict) and isinstance(nested.get("y"), list):
+            nested["y"].append({"z": PropReference(_identifier(rng, prop_names))})
+        elif isinstance(nested, dict):
+            nested["y"] = [PropReference(_identifier(rng, prop_names))]
+        else:
+            layer.props.pop(rng.choice(prop_names), None)
+    else:
+        # In place, as a list
+        if rng.random() < 0.5:
+            layer.children.append("text")
+        elif "text" in layer.children:
+            layer.children.remove("text")
@@ -0,0 +1,88 @@
+"""The children of layers against lists, and the list idioms they support"""
+
+from copy import deepcopy
+from pickle import dumps, loads
+from random import Random
+
+import pytest
+
+from transpiler.PC import DSL, Component, Identifier, Layer
+from transpiler.PC.children import Children
+
+from .random_edits import seeds
+
+
+def grid(count: int) -> tuple[DSL, Layer]:
+    dsl = DSL()
+    component = Component("Grid")
+    layer = Layer("$grid")
+    layer.is_root = True
+    component.add_layer(layer)
+    dsl.add_component(component)
+    for index in range(count):
+        layer.add_child(f"cell {index}")
+    return dsl, layer
+
+
+@pytest.mark.parametrize("count", [0, 3, 40])
+def test_list_idioms(count: int) -> None:
+    dsl, layer = grid(count)
+    expected = [f"cell {index}" for index in range(count)]
+    children = layer.children
+    assert isinstance(children, list) and children == expected
+    assert children + ["x"] == [*expected, "x"]
+
+    edits = [
+        (lambda items: items.append("x")),
+        (lambda items: items.insert(0, "y")),
+        (lambda items: items.remove("x")),
+        (lambda items: items.__setitem__(0, "z")),
+        (lambda items: items.extend(["x", "x"])),
+        (lambda items: items.__iadd__(["w"])),
+        (lambda items: items.remove("x")),
+        (lambda items: items.reverse()),
+        (lambda items: items.__delitem__(slice(0, 2))),
+        (lambda items: items.pop()),
+        (lambda items: items.sort()),
+    ]
+    for edit in edits:
+        dsl.clear_dirty()
+        distinct, digest = set(children), layer.digest
+        edit(children)
+        edit(expected)
+        assert children == expected and layer.children is children
+        assert set(children.distinct()) == set(expected)
+        # The edit is recorded, so that the digests and the journal follow it
+        assert dsl.dirty == {Identifier.of("Grid")}
+        assert (layer.digest == digest) == (set(expected) == distinct)
+        assert str(layer) == str(loads(dumps(layer)))
+    layer.children.clear()
+    assert layer.children == [] and "z" not in layer.children
+
+
+@pytest.mark.parametrize("seed", seeds[:5])
+def test_children_match_a_list(seed: int) -> None:
+    rng = Random(seed)
+    for _ in range(200):
+        children, expected = Children(), []
+        names = [f"c{index}" for index in range(rng.choice([5, 40, 200]))]
+        for _ in range(rng.randrange(1, 120)):
+            child = rng.choice(names)
+            if rng.random() < 0.5:
+                children.append(child)
+                expected.append(child)
+            elif child in expected:
+                children.remove(child)
+                expected.remove(child)
+            else:
+                with pytest.raises(ValueError):
+                    children.remove(child)
+            if expected and rng.random() < 0.1:
+                index = rng.randrange(len(expected))
+                children.insert(index, child)
+                expected.insert(index, child)
+            assert children == expected
+            assert (child in children) == (child in expected)
+            assert set(children.distinct()) == set(expected)
+        for copy in (loads(dumps(children)), deepcopy(children)):
+            assert type(copy) is Children and copy == expected
@@ -0,0 +1,43 @@
+"""Differential tests of the ANTLR and recursive descent decoder backends"""
+
+import pytest
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import documents, generate
+from transpiler.PC.decoder.errors import DecodeError
+
+generated = [
+    generate(),
+    generate(components=3, layers=40, breadth=3, children=2),
+    generate(components=1, layers=60, breadth=1, children=0),
+    generate(components=2, layers=5, breadth=4, children=30),
+]
+
+malformed = [
+    "",
+    "garbage",
+    "dsl",
+    "dsl {",
+    "dsl { component }",
+    "dsl { component A() { } }",
+    "dsl { } trailing",
+    documents[0].replace("{", "", 1),
+    documents[0].replace(";", "", 1),
+    documents[0][: len(documents[0]) // 2],
+]
+
+
+@pytest.mark.parametrize("document", [*documents, *generated])
+def test_backends_agree(document: str) -> None:
+    antlr = decode(document)
+    descent = decode(document, backend="descent")
+    assert antlr == descent
+    assert descent == antlr
+    assert str(antlr) == str(descent)
+    assert repr(antlr) == repr(descent)
+
+
+@pytest.mark.parametrize("document", malformed)
+def test_descent_rejects_malformed(document: str) -> None:
+    with pytest.raises(DecodeError):
+        decode(document, backend="descent")
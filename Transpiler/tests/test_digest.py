@@ -0,0 +1,73 @@
+"""Structural digests of DSL objects, along random edits"""
+
+from pickle import dumps, loads
+
+import pytest
+
+from transpiler.PC import Identifier
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+
+from .random_edits import edited_dsls, seeds
+
+
+def digests(dsl) -> tuple:
+    return (
+        dsl.digest,
+        [component.digest for component in dsl.components],
+        [layer.digest for component in dsl.components for layer in component.layers],
+    )
+
+
+def recomputed_digests(dsl) -> tuple:
+    # A copy with every cached digest dropped
+    # pylint: disable=[protected-access]
+    fresh = loads(dumps(dsl))
+    fresh._digest = None
+    for component in fresh.components:
+        component._digest = None
+        for layer in component.layers:
+            layer._digest = None
+    return digests(fresh)
+
+
+@pytest.mark.parametrize("seed", seeds)
+def test_cached_digests_follow_edits(seed: int) -> None:
+    for dsl, rng in edited_dsls(seed):
+        if rng.random() < 0.5:
+            assert digests(dsl) == recomputed_digests(dsl)
+
+
+def test_equal_documents_have_equal_digests() -> None:
+    text = generate(components=3, layers=20, breadth=3, children=2)
+    assert decode(text).digest == decode(text, backend="descent").digest
+
+
+def test_in_place_edits_keep_equality_exact() -> None:
+    dsl = decode(generate(components=2, layers=6, breadth=2, children=1))
+    component = dsl.components[0]
+    layer = component.layers[1]
+    layer.props = {"a": [1, {"b": 2}]}
+    edits = [
+        (lambda: layer.props.__setitem__("c", 3), lambda: layer.props.pop("c")),
+        (lambda: layer.props["a"].append(4), lambda: layer.props["a"].pop()),
+        (
+            lambda: layer.props["a"][1].update(b=5),
+            lambda: layer.props["a"][1].update(b=2),
+        ),
+        (
+            lambda: component.props.add(Identifier.of("zz")),
+            lambda: component.props.discard(Identifier.of("zz")),
+        ),
+        (lambda: layer.children.append("text"), lambda: layer.children.remove("text")),
+    ]
+    for edit, undo in edits:
+        # Copies with their digests cached, which equality checks first
+        copy = loads(dumps(dsl))
+        assert copy == dsl and digests(copy) == digests(dsl)
+        edit()
+        assert dsl != copy and copy != dsl
+        assert digests(dsl) == recomputed_digests(dsl)
+        undo()
+        assert dsl == copy and copy == dsl
+        assert digests(dsl) == digests(copy)
@@ -0,0 +1,207 @@
+"""Snapshots of DSL objects against the DSL objects they are taken from"""
+
+from copy import deepcopy
+from pickle import dumps, loads
+from random import Random
+
+import pytest
+
+from transpiler.PC import Component, FrozenDSL, Identifier
+from transpiler.PC.errors import InvalidTransactionError
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import generate
+from transpiler.PC.encoder import (
+    collect_violations,
+    collect_violations_incremental,
+    validate_incremental,
+)
+from transpiler.PC.encoder.errors import StructuralIntegrityError
+
+from .random_edits import (
+    component_names,
+    edited_dsls,
+    random_dsl,
+    random_edit,
+    seeds,
+    violation_keys,
+)
+
+
+def graph(dsl) -> list:
+    dependencies = dsl.dependency_graph()
+    return [
+        (
+            identifier,
+            dependencies.get_dependencies(identifier),
+            dependencies.get_dependents(identifier),
+        )
+        for identifier in dependencies.components
+    ]
+
+
+@pytest.mark.parametrize("seed", seeds[:10])
+def test_snapshots_match_their_dsl(seed: int) -> None:
+    versions = []
+    for dsl, _ in edited_dsls(seed, runs=5, edits=30):
+        frozen = dsl.freeze()
+        versions.append((frozen, str(dsl), repr(dsl), dsl.digest))
+        assert isinstance(frozen, FrozenDSL) and frozen.freeze() is frozen
+        assert frozen == dsl and dsl == frozen
+        assert frozen.digest == dsl.digest
+        expected = violation_keys(collect_violations(dsl))
+        assert violation_keys(collect_violations(frozen)) == expected
+        assert violation_keys(collect_violations_incremental(frozen)) == expected
+        assert graph(frozen) == graph(dsl)
+        thawed = frozen.thaw()
+        assert not isinstance(thawed, FrozenDSL)
+        assert thawed == frozen and str(thawed) == str(dsl)
+        assert loads(dumps(frozen)) == frozen
+    # Editing the DSL leaves the earlier snapshots unchanged
+    for frozen, text, representation, digest in versions:
+        assert str(frozen) == text and repr(frozen) == representation
+        assert frozen.digest == digest
+
+
+@pytest.mark.parametrize("seed", seeds[:10])
+def test_evolve_matches_edits(seed: int) -> None:
+    rng = Random(seed)
+    checked = 0
+    while checked < 20:
+        dsl = random_dsl(rng)
+        for _ in range(rng.randrange(1, 20)):
+            random_edit(dsl, rng)
+        frozen = dsl.freeze()
+        if not frozen.components or not all(c.layers for c in frozen.components):
+            continue
+        component = rng.choice(frozen.components)
+        layer = rng.choice(component.layers)
+        props = {"v": [rng.randrange(3)], "w": {"x": "y"}}
+        library = rng.choice(["mui", "custom"])
+        name = Identifier.of(rng.choice(component_names))
+        evolved = frozen.evolve_layer(
+            component.identifier,
+            layer.identifier,
+            props=props,
+            import_library=library,
+            import_name=name,
+        )
+        # evolve copies the props it is given
+        props["v"].append(9)
+
+        edited = frozen.thaw()
+        edited_layer = edited.get_component(component.identifier).get_layer(
+            layer.identifier
+        )
+        edited_layer.props = {"v": props["v"][:1], "w": {"x": "y"}}
+        edited_layer.import_library = library
+        edited_layer.import_name = name
+        assert str(evolved) == str(edited) and evolved == edited
+        assert evolved.digest == edited.digest
+        assert graph(evolved) == graph(edited)
+        assert violation_keys(
+            collect_violations_incremental(evolved)
+        ) == violation_keys(collect_violations(edited))
+        assert frozen == dsl and str(frozen) == str(dsl)
+
+        deleted = evolved.evolve(deleted_components=[component.identifier])
+        edited.delete_component(component.identifier)
+        assert str(deleted) == str(edited) and deleted == edited
+
+        restored = deleted.evolve(
+            components=[frozen.get_component(component.identifier)]
+        )
+        edited.add_component(frozen.thaw().get_component(component.identifier))
+        assert str(restored) == str(edited)
+        checked += 1
+
+
+def test_snapshots_are_read_only() -> None:
+    frozen = decode(generate(components=2, layers=5)).freeze()
+    component = frozen.components[0]
+    layer = component.layers[0]
+    edits = [
+        lambda: frozen.add_component(Component("Z")),
+        lambda: frozen.delete_component(component.identifier),
+        lambda: frozen.touch(component.identifier),
+        lambda: component.add_prop(Identifier.of("zz")),
+        lambda: component.delete_layer(layer.identifier),
+        lambda: setattr(layer, "props", {}),
+        lambda: setattr(layer, "is_root", not layer.is_root),
+        lambda: layer.add_child("x"),
+        lambda: layer.children.append("x"),
+        lambda: layer.children.__setitem__(slice(None), []),
+        lambda: layer.delete_parent(),
+    ]
+    for edit in edits:
+        with pytest.raises(InvalidTransactionError):
+            edit()
+
+
+@pytest.mark.parametrize("seed", seeds[:5])
+def test_snapshots_keep_their_journal_and_digests(seed: int) -> None:
+    for dsl, rng in edited_dsls(seed, runs=5, edits=20):
+        frozen = dsl.freeze()
+        if not frozen.components or rng.random() < 0.5:
+            continue
+        scope, digest = frozen.dirty_scope(), frozen.digest
+        components = frozen.components
+        cached = [
+            (node, node.digest)
+            for component in components
+            for node in [component, *component.layers]
+        ]
+        # Validating a snapshot incrementally doesn't write its journal
+        first = violation_keys(collect_violations_incremental(frozen))
+        assert violation_keys(collect_violations_incremental(frozen)) == first
+        try:
+            validate_incremental(frozen)
+        except StructuralIntegrityError:
+            pass
+        assert frozen.dirty_scope() == scope and frozen.digest == digest
+
+        # Evolving a snapshot doesn't drop the digests of the nodes it shares
+        component = rng.choice(components)
+        frozen.evolve(components=[component])
+        if component.layers:
+            frozen.evolve_layer(
+                component.identifier, component.layers[0].identifier, props={}
+            )
+        frozen.evolve(deleted_components=[component.identifier])
+        # pylint: disable=[protected-access]
+        assert all(node._digest == value for node, value in cached)
+
+
+def test_props_are_read_only() -> None:
+    frozen = decode(generate(components=1, layers=3)).freeze()
+    evolved = frozen.evolve_layer(
+        frozen.components[0].identifier,
+        frozen.components[0].layers[0].identifier,
+        props={"a": [1, {"b": [2]}], "c": {"d": 3}},
+    )
+    layer = evolved.components[0].layers[0]
+    text, digest = str(evolved), evolved.digest
+    edits = [
+        lambda: layer.props.__setitem__("x", 1),
+        lambda: layer.props.update(x=1),
+        lambda: layer.props.pop("a"),
+        lambda: layer.props.clear(),
+        lambda: layer.props["a"].append(1),
+        lambda: layer.props["a"].sort(),
+        lambda: layer.props["a"].__setitem__(0, 2),
+        lambda: layer.props["a"][1]["b"].extend([3]),
+        lambda: layer.props["c"].setdefault("e", 4),
+    ]
+    for edit in edits:
+        with pytest.raises(InvalidTransactionError):
+            edit()
+    assert str(evolved) == text and evolved.digest == digest
+
+    for copy in (loads(dumps(evolved)), deepcopy(evolved)):
+        assert copy == evolved and str(copy) == text
+        with pytest.raises(InvalidTransactionError):
+            copy.components[0].layers[0].props["a"].append(1)
+
+    # Thawed props are mutable copies
+    thawed = evolved.thaw().components[0].layers[0]
+    thawed.props["a"][1]["b"].append(3)
+    assert layer.props["a"][1]["b"] == [2]
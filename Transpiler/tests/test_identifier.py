@@ -0,0 +1,110 @@
+"""Conformance of Identifier.is_valid with the IDENTIFIER rule of the grammar"""
+
+from random import Random
+
+import pytest
+from antlr4 import InputStream
+
+from transpiler.PC.identifier import Identifier
+from transpiler.PC.decoder.lib import PCLexer
+
+accepted = [
+    # ASCII
+    "a",
+    "Z",
+    "$",
+    "_",
+    "$a",
+    "_a",
+    "abc123",
+    "a_b",
+    "camelCase",
+    "$_9",
+    # \p{L}
+    "é",
+    "aé",
+    "日本",
+    "Ωμέγα",
+    # \p{Mn}
+    "a\u0301",
+    "e\u0300\u0301",
+    # \p{Nd}
+    "a\u0663",
+    "x\uff19",
+    # \p{Pc}
+    "a\u203f",
+    "a\u2040b",
+    # ZWNJ and ZWJ
+    "a\u200cb",
+    "a\u200db",
+    # \u escapes
+    "\\u0041",
+    "a\\u00e9",
+    "\\u00e9b",
+    "\\u{41}",
+    "\\u{1F600}",
+    "a\\u{_4_1}",
+    "\\u0041\\u{42}",
+]
+
+rejected = [
+    "",
+    "a-b",
+    "a b",
+    " a",
+    "a ",
+    "1a",
+    "9",
+    "a!",
+    "a.b",
+    "-",
+    # \p{Mn}, \p{Nd}, \p{Pc}, ZWNJ and ZWJ can't start an identifier
+    "\u0301a",
+    "\u0663a",
+    "\u203fa",
+    "\u200ca",
+    "\u200da",
+    # Malformed \u escapes
+    "\\",
+    "a\\",
+    "\\u41",
+    "\\u004",
+    "\\u{}",
+    "\\u{4}",
+    "\\u{41",
+    "\\x41",
+    "\\U0041",
+]
+
+
+def matches_pattern(value: str) -> bool:
+    return Identifier.pattern_identifier.fullmatch(value) is not None
+
+
+@pytest.mark.parametrize("value", accepted)
+def test_accepted(value: str) -> None:
+    assert Identifier.is_valid(value)
+    assert matches_pattern(value)
+
+
+@pytest.mark.parametrize("value", rejected)
+def test_rejected(value: str) -> None:
+    assert not Identifier.is_valid(value)
+    assert not matches_pattern(value)
+
+
+def test_ascii_agrees_with_pattern() -> None:
+    # The ASCII fast path of is_valid against the RegEx, on random short strings
+    rng = Random(0)
+    alphabet = "aZ$_09 -.!\\u{}"
+    for _ in range(20000):
+        value = "".join(rng.choice(alphabet) for _ in range(rng.randrange(6)))
+        assert Identifier.is_valid(value) == matches_pattern(value), value
+
+
+@pytest.mark.parametrize("value", accepted)
+def test_lexed_as_single_identifier(value: str) -> None:
+    tokens = PCLexer(InputStream(value)).getAllTokens()
+    assert [(token.type, token.text) for token in tokens] == [
+        (PCLexer.IDENTIFIER, value)
+    ]
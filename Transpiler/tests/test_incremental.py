@@ -0,0 +1,57 @@
+"""validate_incremental against validate, along random edits of DSL objects"""
+
+import pytest
+
+from transpiler.PC.encoder import (
+    collect_violations,
+    collect_violations_incremental,
+    validate_incremental,
+)
+from transpiler.PC.encoder.errors import StructuralIntegrityError
+
+from .random_edits import edited_dsls, seeds, violation_keys
+
+
+def first_violation(validator, dsl) -> str:
+    try:
+        validator(dsl)
+    except StructuralIntegrityError as exc:
+        return str(exc)
+    return ""
+
+
+@pytest.mark.parametrize("seed", seeds)
+def test_incremental_matches_full(seed: int) -> None:
+    for dsl, rng in edited_dsls(seed):
+        full = collect_violations(dsl)
+        if rng.random() < 0.5:
+            incremental = collect_violations_incremental(dsl)
+            assert violation_keys(incremental) == violation_keys(full)
+        else:
+            # Either validator may raise about any of the violations first
+            assert bool(first_violation(validate_incremental, dsl)) == bool(full)
+
+
+@pytest.mark.parametrize("seed", seeds[:5])
+def test_dirty_scope_covers_references(seed: int) -> None:
+    for dsl, rng in edited_dsls(seed):
+        components = dsl.components
+        if not components or rng.random() < 0.5:
+            continue
+        dsl.clear_dirty()
+        assert dsl.dirty == set() and dsl.dirty_scope() == {}
+        # Deleting a component affects the custom layers importing it
+        component = rng.choice(components)
+        references = [
+            (referencing.identifier, layer.identifier)
+            for referencing in components
+            for layer in referencing.layers
+            if layer.import_library == "custom"
+            and layer.import_name == component.identifier
+        ]
+        dsl.delete_component(component.identifier)
+        scope = dsl.dirty_scope()
+        assert scope[component.identifier] is None
+        for component_identifier, layer_identifier in references:
+            layers = scope[component_identifier]
+            assert layers is None or layer_identifier in layers
@@ -0,0 +1,26 @@
+"""The index of custom references of DSL objects, along random edits"""
+
+import pytest
+
+from transpiler.PC import Identifier
+
+from .random_edits import component_names, edited_dsls, seeds
+
+
+@pytest.mark.parametrize("seed", seeds)
+def test_references_follow_edits(seed: int) -> None:
+    for dsl, _ in edited_dsls(seed):
+        expected: dict[Identifier, set[int]] = {}
+        for component in dsl.components:
+            for layer in component.layers:
+                if layer.import_library == "custom" and isinstance(
+                    layer.import_name, Identifier
+                ):
+                    expected.setdefault(layer.import_name, set()).add(id(layer))
+        for name in [*component_names, "Box"]:
+            identifier = Identifier.of(name)
+            references = dsl.get_references(identifier)
+            assert len(references) == len(expected.get(identifier, ()))
+            assert {id(layer) for layer in references} == expected.get(
+                identifier, set()
+            )
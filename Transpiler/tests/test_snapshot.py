@@ -0,0 +1,52 @@
+"""The snapshot of the ATN and DFA of the generated lexer and parser"""
+
+import pytest
+from antlr4.atn.ATNDeserializer import ATNDeserializer
+
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import documents
+from transpiler.PC.decoder.lib import PCLexer
+from transpiler.PC.decoder.lib.PCLexer import serializedATN
+from transpiler.PC.decoder.snapshot import (
+    atn_key,
+    build_snapshot,
+    deserializing_from,
+    load_snapshot,
+)
+
+
+def test_deserialize_returns_the_provided_atns() -> None:
+    deserialize = ATNDeserializer.deserialize
+    with deserializing_from({atn_key(serializedATN()): PCLexer.atn}):
+        assert ATNDeserializer().deserialize(serializedATN()) is PCLexer.atn
+    # Serialized ATNs without a provided ATN are deserialized as usual
+    with deserializing_from({}):
+        atn = ATNDeserializer().deserialize(serializedATN())
+        assert atn is not PCLexer.atn
+        assert len(atn.states) == len(PCLexer.atn.states)
+    assert ATNDeserializer.deserialize is deserialize
+
+
+def test_deserialize_is_restored_when_the_context_raises() -> None:
+    deserialize = ATNDeserializer.deserialize
+    with pytest.raises(ImportError):
+        with deserializing_from({}):
+            raise ImportError("generated module")
+    assert ATNDeserializer.deserialize is deserialize
+
+
+def test_missing_or_stale_snapshot_isnt_loaded(tmp_path) -> None:
+    assert not load_snapshot(str(tmp_path / "missing.snapshot"))
+    stale = tmp_path / "stale.snapshot"
+    stale.write_bytes(b"not a snapshot")
+    assert not load_snapshot(str(stale))
+
+
+def test_snapshot_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "PC.snapshot")
+    build_snapshot(path)
+    deserialize = ATNDeserializer.deserialize
+    assert load_snapshot(path)
+    assert ATNDeserializer.deserialize is deserialize
+    for document in documents:
+        assert decode(document) == decode(document, backend="descent")
@@ -0,0 +1,100 @@
+"""The single-pass validate against the sequential validators, on corrupted documents"""
+
+from random import Random
+from typing import Optional
+
+import pytest
+
+from transpiler.PC import DSL, Identifier, PropReference
+from transpiler.PC.decoder import decode
+from transpiler.PC.decoder.corpus import documents, generate
+from transpiler.PC.encoder import validator
+
+sequential_validators = [
+    validator.validate_min_one_root_layer,
+    validator.validate_no_orphan_non_root_layers,
+    validator.validate_no_unknown_parent_layers,
+    validator.validate_no_unknown_child_layers,
+    validator.validate_identifier_import_name_in_layer,
+    validator.validate_string_import_library_in_layer,
+    validator.validate_no_references_to_unknown_custom_component,
+    validator.validate_no_mismatching_props_in_references_to_custom_component,
+    validator.validate_no_unknown_prop_reference_in_layer_children,
+    validator.validate_no_unknown_prop_reference_in_layer_props,
+]
+
+corpus = [*documents, generate(components=3, layers=8, breadth=2, children=1)]
+
+
+def outcome(validate) -> Optional[tuple]:
+    # The error raised, with its cause, or None
+    try:
+        validate()
+    except Exception as exc:  # pylint: disable=[broad-except]
+        cause = exc.__cause__
+        return (type(exc), str(exc), type(cause), None if cause is None else str(cause))
+    return None
+
+
+def validate_sequentially(dsl: DSL) -> None:
+    for validate in sequential_validators:
+        validate(dsl)
+
+
+def corrupt(dsl: DSL, rng: Random) -> None:
+    # Corrupts a layer, bypassing the checks of the setters where they reject it
+    # pylint: disable=[protected-access]
+    component = rng.choice(dsl.components)
+    layer = rng.choice(component.layers)
+    kind = rng.randrange(9)
+    if kind == 0:
+        layer._is_root = False
+    elif kind == 1:
+        layer._parent = None
+        layer._is_root = False
+    elif kind == 2:
+        layer._parent = Identifier("nope")
+    elif kind == 3:
+        layer._children.append(Identifier("ghost"))
+    elif kind == 4:
+        layer.import_name = rng.choice([None, "str"])
+    elif kind == 5:
+        layer.import_library = rng.choice([None, 3, "custom"])
+    elif kind == 6:
+        layer.import_library = "custom"
+        layer.import_name = rng.choice([Identifier("Missing"), component.identifier])
+    elif kind == 7:
+        layer._children.append(PropReference(Identifier("unknownp")))
+    else:
+        layer.props["zz"] = {"a": PropReference(Identifier("unk"))}
+
+
+def corrupted_documents(seed: int, count: int) -> list[DSL]:
+    rng = Random(seed)
+    corrupted = []
+    for _ in range(count):
+        dsl = decode(rng.choice(corpus), backend="descent")
+        for _ in range(rng.randrange(5)):
+            corrupt(dsl, rng)
+        corrupted.append(dsl)
+    return corrupted
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_validate_raises_as_sequential_validators(seed: int) -> None:
+    for dsl in corrupted_documents(seed, 200):
+        assert outcome(lambda: validator.validate(dsl)) == outcome(
+            lambda: validate_sequentially(dsl)
+        )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_collect_reports_the_raised_violation_first(seed: int) -> None:
+    for dsl in corrupted_documents(seed, 200):
+        raised = outcome(lambda: validator.validate(dsl))
+        violations = validator.collect_violations(dsl)
+        assert (raised is None) == (violations == [])
+        if violations:
+            assert violations[0].message == raised[1]
+            codes = [violation.code for violation in violations]
+            assert codes == sorted(codes, key=validator.codes.index)
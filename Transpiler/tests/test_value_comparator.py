@@ -0,0 +1,90 @@
+"""values_equal against brute-force comparisons, on random values of layers"""
+
+from random import Random
+
+import pytest
+
+from transpiler.PC import Identifier, PropReference
+from transpiler.PC.digest import canonical_value
+from transpiler.PC.value_comparator import values_equal
+
+
+def random_value(rng: Random, depth: int = 0):
+    kind = rng.randrange(9 if depth < 3 else 6)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return True
+    if kind == 2:
+        return rng.choice([0, 1, 1.0, 2, 2.5])
+    if kind == 3:
+        return rng.choice(["a", "b"])
+    if kind == 4:
+        return PropReference(Identifier.of(rng.choice("pq")))
+    if kind == 5:
+        return False
+    if kind < 7:
+        return {
+            rng.choice("xyz"): random_value(rng, depth + 1)
+            for _ in range(rng.randrange(3))
+        }
+    return [random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+
+
+def mutated(rng: Random, value):
+    # A value often equal to the provided one, with its lists often reordered
+    if isinstance(value, list):
+        items = [mutated(rng, item) if rng.random() < 0.3 else item for item in value]
+        if rng.random() < 0.5:
+            rng.shuffle(items)
+        return items
+    if isinstance(value, dict):
+        return {
+            key: mutated(rng, item) if rng.random() < 0.3 else item
+            for key, item in value.items()
+        }
+    return random_value(rng, 3) if rng.random() < 0.3 else value
+
+
+def multisets_equal(a, b) -> bool:
+    # Lists as multisets, matching their items pairwise
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and a.keys() == b.keys()
+            and all(multisets_equal(a[key], b[key]) for key in a)
+        )
+    if isinstance(a, list):
+        if not isinstance(b, list) or len(a) != len(b):
+            return False
+        rest = [*b]
+        for item in a:
+            for index, other in enumerate(rest):
+                if multisets_equal(item, other):
+                    del rest[index]
+                    break
+            else:
+                return False
+        return True
+    if isinstance(b, (dict, list)):
+        return False
+    return a == b
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_values_equal(seed: int) -> None:
+    rng = Random(seed)
+    for _ in range(2000):
+        a = random_value(rng)
+        b = mutated(rng, a) if rng.random() < 0.8 else random_value(rng)
+        strict = values_equal(a, b, "strict")
+        legacy = values_equal(a, b)
+        assert strict == (a == b)
+        assert legacy == multisets_equal(a, b)
+        assert legacy == (canonical_value(a) == canonical_value(b))
+        assert legacy or not strict
+
+
+def test_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        values_equal([], [], "unknown")
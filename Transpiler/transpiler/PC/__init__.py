@@ -5,6 +5,8 @@ from .component import Component
 from .layer import Layer
 from .identifier import Identifier
 from .prop_reference import PropReference
+from .dependency_graph import DependencyGraph
+from .frozen import FrozenDSL, FrozenComponent, FrozenLayer
 
 
 from .errors import (
@@ -12,6 +14,7 @@ from .errors import (
     InvalidTransactionError,
     IdentifierNotFoundError,
     DuplicateIdentifierError,
+    CyclicReferenceError,
 )
 
 __all__ = [
@@ -20,8 +23,13 @@ __all__ = [
     "Identifier",
     "Layer",
     "PropReference",
+    "DependencyGraph",
+    "FrozenDSL",
+    "FrozenComponent",
+    "FrozenLayer",
     "InvalidIdentifierError",
     "InvalidTransactionError",
     "IdentifierNotFoundError",
     "DuplicateIdentifierError",
+    "CyclicReferenceError",
 ]
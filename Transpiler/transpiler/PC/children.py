@@ -0,0 +1,207 @@
+"""Children of a Layer in ".pc" DSL"""
+
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Iterable,
+    KeysView,
+    Optional,
+    SupportsIndex,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .layer import Layer  # pragma: no cover
+
+
+class Children(list):
+    """
+    The children of a Layer, in insertion order
+
+    It is a list, so the children are read and changed like one; every change
+    is recorded as a modification of the layer, see DSL.touch. Changing the
+    list doesn't update the parent of child layers: use Layer.add_child and
+    Layer.remove_child for that.
+
+    A child can be added more than once, like a string repeated in the
+    children of a layer; remove drops its first occurrence. Past
+    indexed_min_size children, the distinct children are indexed with the
+    position of their first occurrence, so that membership tests take
+    constant time and removals don't scan the list from its start. append
+    and remove keep the index up to date, the other changes drop it, to be
+    rebuilt when next needed
+    """
+
+    __slots__ = ("_owner", "_first", "_extra", "_shift")
+
+    # The number of children from which they are indexed
+    indexed_min_size: ClassVar[int] = 16
+
+    def __init__(
+        self, children: Iterable[Layer.Child] = (), owner: Optional[Layer] = None
+    ) -> None:
+        """
+        Initialise a Children object
+
+        Args:
+            children (Iterable[Layer.Child], optional): The children, in order.
+            Defaults to ().
+            owner (Optional[Layer], optional): The layer the modifications are
+            recorded for. Defaults to None.
+        """
+        super().__init__(children)
+        self._owner: Optional[Layer] = owner
+        # The position of the first occurrence of every child, when it was
+        # indexed; None while the children aren't indexed
+        self._first: Optional[dict[Layer.Child, int]] = None
+        # The number of occurrences of the children added more than once, minus one
+        self._extra: dict[Layer.Child, int] = {}
+        # The number of children removed before the end of the list since they
+        # were indexed; a child is at most that many places before its position
+        self._shift: int = 0
+
+    def __contains__(self, child: object) -> bool:
+        first = self.__index()
+        if first is None:
+            return super().__contains__(child)
+        return child in first
+
+    def __reduce__(self) -> tuple:
+        # Pickled and copied without the index, rebuilt when needed
+        return (type(self), (list(self),), self._owner)
+
+    def __setstate__(self, owner: Optional[Layer]) -> None:
+        self._owner = owner
+
+    def append(self, child: Layer.Child) -> None:
+        """
+        adds a child after the others
+
+        Args:
+            child (Layer.Child): The child to be added
+        """
+        super().append(child)
+        if self._first is not None:
+            if child in self._first:
+                self._extra[child] = self._extra.get(child, 0) + 1
+            else:
+                self._first[child] = len(self) - 1
+        self.__touch()
+
+    def remove(self, child: Layer.Child) -> None:
+        """
+        removes the first occurrence of a child
+
+        Args:
+            child (Layer.Child): The child to be removed
+
+        Raises:
+            ValueError: If the child isn't present
+        """
+        first = self.__index()
+        if first is None:
+            super().remove(child)
+            self.__touch()
+            return
+        if child not in first:
+            raise ValueError("The child isn't present")
+        hint = first[child]
+        position = self.index(child, max(0, hint - self._shift), hint + 1)
+        super().__delitem__(position)
+        if child in self._extra:
+            # The next occurrence becomes the first one
+            first[child] = self.index(child, position)
+            self._extra[child] -= 1
+            if not self._extra[child]:
+                del self._extra[child]
+        else:
+            del first[child]
+        if position < len(self):
+            self._shift += 1
+        self.__touch()
+
+    def distinct(self) -> KeysView[Layer.Child]:
+        """
+        The children, each once, as a set-like view
+
+        Returns:
+            KeysView[Layer.Child]: The distinct children
+        """
+        first = self.__index()
+        if first is None:
+            return dict.fromkeys(self).keys()
+        return first.keys()
+
+    def insert(self, index: SupportsIndex, child: Layer.Child) -> None:
+        super().insert(index, child)
+        self.__forget()
+
+    def extend(self, children: Iterable[Layer.Child]) -> None:
+        super().extend(children)
+        self.__forget()
+
+    def pop(self, index: SupportsIndex = -1) -> Layer.Child:
+        child = super().pop(index)
+        self.__forget()
+        return child
+
+    def clear(self) -> None:
+        super().clear()
+        self.__forget()
+
+    def sort(self, *args: object, **kwargs: object) -> None:
+        super().sort(*args, **kwargs)
+        self.__forget()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__forget()
+
+    def __setitem__(
+        self,
+        index: Union[SupportsIndex, slice],
+        value: Union[Layer.Child, Iterable[Layer.Child]],
+    ) -> None:
+        super().__setitem__(index, value)
+        self.__forget()
+
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        super().__delitem__(index)
+        self.__forget()
+
+    def __iadd__(self, children: Iterable[Layer.Child]) -> Children:
+        super().__iadd__(children)
+        self.__forget()
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> Children:
+        super().__imul__(count)
+        self.__forget()
+        return self
+
+    def __index(self) -> Optional[dict[Layer.Child, int]]:
+        # The index of the children, built when there are enough of them or
+        # when the removals have made the positions it holds too loose
+        if self._first is not None and self._shift <= len(self):
+            return self._first
+        if len(self) <= Children.indexed_min_size:
+            self._first = None
+            return None
+        self._first, self._extra, self._shift = {}, {}, 0
+        for position, child in enumerate(self):
+            if child in self._first:
+                self._extra[child] = self._extra.get(child, 0) + 1
+            else:
+                self._first[child] = position
+        return self._first
+
+    def __forget(self) -> None:
+        # Drops the index after a change it doesn't follow
+        self._first, self._extra, self._shift = None, {}, 0
+        self.__touch()
+
+    def __touch(self) -> None:
+        if self._owner is not None:
+            # pylint: disable=[protected-access]
+            self._owner._touch()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
-from re import sub as regex_substitute
-
 from .identifier import Identifier
+from .tracked import TrackedSet
+from .printer import Printer
+from .digest import digest, canonical_unordered, canonical_value
 from .errors import IdentifierNotFoundError, DuplicateIdentifierError
 
 if TYPE_CHECKING:
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 class Component:
     """Represents a ".pc" Component object"""
 
+    __slots__ = ("_dsl", "_identifier", "_props", "_layers", "_digest")
+
     def __init__(self, name: str) -> None:
         """
         Initialize a Component object
@@ -24,11 +27,14 @@ class Component:
             name (str): The value of the Identifier for the Component
         """
         self._dsl: Optional[DSL] = None
-        self._identifier: Identifier = Identifier(name)
-        self._props: set[Identifier] = set()
+        self._identifier: Identifier = Identifier.of(name)
+        self._props: set[Identifier] = TrackedSet(owner=self)
         self._layers: dict[Identifier, Layer] = {}
+        self._digest: Optional[bytes] = None
 
     def __eq__(self, other: Component) -> bool:
+        if self.digest != other.digest:
+            return False
         if self._identifier != other.identifier:
             return False
         if self._props != other._props:
@@ -38,11 +44,14 @@ class Component:
         return True
 
     def __str__(self) -> str:
-        return self.__stringify()
+        parts: list[str] = []
+        Printer(parts.append, pretty=True).print_component(self)
+        return "".join(parts)
 
     def __repr__(self) -> str:
-        component_string = self.__stringify()
-        return regex_substitute(r"[\t\n]+", "", component_string)
+        parts: list[str] = []
+        Printer(parts.append, pretty=False).print_component(self)
+        return "".join(parts)
 
     @property
     def identifier(self) -> Identifier:
@@ -54,13 +63,37 @@ class Component:
         """
         return self._identifier
 
+    @property
+    def digest(self) -> bytes:
+        """
+        The structural digest of the component and its layers, equal for equal
+        components, usable as a cache key for the code generated for it;
+        computed on first use, and again after the component is modified
+
+        Returns:
+            bytes: The digest of the component
+        """
+        if self._digest is None:
+            self._digest = digest(
+                b"component",
+                canonical_value(self._identifier),
+                canonical_unordered(
+                    "p", [canonical_value(prop) for prop in self._props]
+                ),
+                canonical_unordered(
+                    "l", [layer.digest for layer in self._layers.values()]
+                ),
+            )
+        return self._digest
+
     @property
     def props(self) -> set[Identifier]:
         """
         getter for the _props attribute
 
         Returns:
-            set[Identifier]: The set of props associated to the component
+            set[Identifier]: The set of props associated to the component; its
+            in-place modifications are recorded as modifications of the component
         """
         return self._props
 
@@ -146,6 +179,10 @@ class Component:
         # pylint: disable=[protected-access]
         layer._component = self
         self._layers[layer.identifier] = layer
+        if self._dsl is not None:
+            self._dsl._add_reference(layer)
+        # Adding a layer can't invalidate the other layers
+        self._touch(layer.identifier)
 
     def delete_layer(self, identifier: Identifier) -> None:
         """
@@ -163,27 +200,24 @@ class Component:
             )
         associated_layer = self._layers[identifier]
         # pylint: disable=[protected-access]
+        if self._dsl is not None:
+            self._dsl._remove_reference(associated_layer)
         associated_layer._component = None
         del self._layers[identifier]
+        self._touch()
 
-    def __stringify(self) -> str:
-        # constants
-        tab = "\t"
-        newline = "\n"
-        open_brace = "{"
-        closed_brace = "}"
-
-        prop_separator = ", "
-        props_string = f"{prop_separator.join([identifier.value for identifier in sorted(self._props)])}"
-        layers_string = (
-            f"{newline.join([str(layer) for layer in self._layers.values()])}"
-        )
-        layers_string = regex_substitute(r"(\n)", r"\1\t", layers_string)
-        return (
-            # header
-            f"component {self._identifier.value}({props_string}) {open_brace}"
-            # layers
-            f"{newline}{tab}{layers_string}{newline}"
-            # footer
-            f"{closed_brace};"
-        )
+    def _touch(
+        self, layer: Optional[Identifier] = None, dependents: bool = False
+    ) -> None:
+        """
+        records a modification of the component in the journal of its DSL
+
+        Args:
+            layer (Optional[Identifier], optional): Identifier of the modified Layer,
+            None when the component is modified as a whole. Defaults to None.
+            dependents (bool, optional): Whether the modification affects the
+            components referencing this one. Defaults to False.
+        """
+        self._digest = None
+        if self._dsl is not None:
+            self._dsl.touch(self._identifier, layer=layer, dependents=dependents)
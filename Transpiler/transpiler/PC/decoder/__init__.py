@@ -1,5 +1,29 @@
 """The decoder module"""
 
-from .decode import decode
+from time import perf_counter
 
-__all__ = ["decode"]
+_start = perf_counter()
+
+# pylint: disable=[wrong-import-position]
+from .snapshot import load_snapshot
+
+# Install the prebuilt ATN and DFA snapshot before the generated lexer and
+# parser are imported, sparing the deserialization of their ATN
+snapshot_loaded: bool = load_snapshot()
+
+from .decode import decode, decode_with_mode
+from .cache import DecodeCache
+from .warmup import warmup, dfa_state_counts
+
+# Seconds spent importing the generated lexer and parser and loading the snapshot
+startup_time: float = perf_counter() - _start
+
+__all__ = [
+    "decode",
+    "decode_with_mode",
+    "DecodeCache",
+    "warmup",
+    "dfa_state_counts",
+    "snapshot_loaded",
+    "startup_time",
+]
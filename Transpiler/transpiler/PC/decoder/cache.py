@@ -0,0 +1,159 @@
+"""The content-addressed cache for decoded DSL objects"""
+
+from collections import OrderedDict
+from hashlib import blake2b
+from pickle import dumps as pickle_dumps, loads as pickle_loads, HIGHEST_PROTOCOL
+from threading import Lock
+
+from ..dsl import DSL
+
+from .decode import decode
+
+
+class DecodeCache:
+    """
+    A bounded LRU cache in front of decode, keyed by a hash of the DSL string
+
+    Decoded DSL objects are stored pickled, so every hit returns a new DSL
+    object that the caller is free to mutate without affecting the cache
+    """
+
+    def __init__(
+        self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        Initialise a DecodeCache object
+
+        Args:
+            max_entries (int, optional): maximum number of cached DSL objects. Defaults to 256.
+            max_bytes (int, optional): maximum total size of the pickled DSL objects.
+            Defaults to 64 MiB.
+        """
+        self._max_entries: int = max_entries
+        self._max_bytes: int = max_bytes
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock: Lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        """
+        getter for the _hits attribute
+
+        Returns:
+            int: The number of lookups served from the cache
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        getter for the _misses attribute
+
+        Returns:
+            int: The number of lookups that had to decode the DSL string
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        getter for the _evictions attribute
+
+        Returns:
+            int: The number of entries evicted to stay within the budget
+        """
+        return self._evictions
+
+    @property
+    def entries(self) -> int:
+        """
+        The number of cached DSL objects
+
+        Returns:
+            int: The number of cached DSL objects
+        """
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        getter for the _size attribute
+
+        Returns:
+            int: The total size in bytes of the cached DSL objects
+        """
+        return self._size
+
+    @staticmethod
+    def key(dsl: str, backend: str = "antlr") -> bytes:
+        """
+        The cache key of a DSL string
+
+        Args:
+            dsl (str): The DSL string
+            backend (str, optional): The decoder backend. Defaults to "antlr".
+
+        Returns:
+            bytes: The digest of the backend and the DSL string
+        """
+        digest = blake2b(backend.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(dsl.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def decode(self, dsl: str, backend: str = "antlr") -> DSL:
+        """
+        Decodes a DSL string, reusing the result of an earlier decode of the same string
+
+        Args:
+            dsl (str): The DSL string to be decoded
+            backend (str, optional): The decoder backend. Defaults to "antlr".
+
+        Raises:
+            DecodeError: If any stage of decoding fails
+
+        Returns:
+            DSL: The decoded DSL, owned by the caller
+        """
+        key = self.key(dsl, backend)
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if snapshot is not None:
+            return pickle_loads(snapshot)
+
+        decoded_dsl = decode(dsl, backend=backend)
+        self.__store(key, pickle_dumps(decoded_dsl, protocol=HIGHEST_PROTOCOL))
+        return decoded_dsl
+
+    def clear(self) -> None:
+        """
+        removes every entry from the cache, keeping the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __store(self, key: bytes, snapshot: bytes) -> None:
+        if len(snapshot) > self._max_bytes or self._max_entries <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = snapshot
+            self._size += len(snapshot)
+            # Evict the least recently used entries until within the budget
+            while (
+                len(self._entries) > self._max_entries or self._size > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
@@ -0,0 +1,159 @@
+"""A corpus of representative ".pc" DSL strings
+
+Shared by the decoder backends to check they decode to equal DSL objects
+"""
+
+
+documents: tuple[str, ...] = (
+    # A single component with a single root layer
+    """
+    dsl {
+        component App() {
+            layer root $id0 {
+                type "mui" Box;
+                props {};
+                parent null;
+                children [];
+            };
+        };
+    };
+    """,
+    # Props of every value type, nested objects and arrays, trailing commas
+    """
+    dsl {
+        component Card(title, body) {
+            layer root $id0 {
+                type "mui" Box;
+                props {
+                    "sx" = {
+                        "padding" = 2,
+                        "margin" = -1.25,
+                        "items" = [1, 2.5, -3, true, false, null, "x", prop title,],
+                        "nested" = [[], {}, [{"deep" = [prop body]}]],
+                    },
+                    "label" = prop title,
+                    "enabled" = true,
+                };
+                parent null;
+                children [
+                    $id1,
+                    "hello world",
+                    prop body,
+                    $id2,
+                ];
+            };
+            layer $id1 {
+                type "mui" Typography;
+                props {"variant" = "h1",};
+                parent $id0;
+                children ["Title"];
+            };
+            layer $id2 {
+                type "custom" Other;
+                props {"x" = 1};
+                parent $id0;
+                children [];
+            };
+        };
+        component Other(x) {
+            layer root $id0 {
+                type "mui" Box;
+                props {};
+                parent null;
+                children [prop x];
+            };
+        };
+    };
+    """,
+    # Multiple root layers, layers declared before their parents, deep nesting
+    """
+    dsl {
+        component List(items) {
+            layer $id3 {
+                type "mui" ListItemText;
+                props {"primary" = prop items};
+                parent $id2;
+                children [];
+            };
+            layer root $id0 {
+                type "mui" List;
+                props {};
+                parent null;
+                children [$id1];
+            };
+            layer $id1 {
+                type "mui" ListItem;
+                props {};
+                parent $id0;
+                children [$id2, "trailing text"];
+            };
+            layer $id2 {
+                type "mui" ListItemButton;
+                props {"dense" = false};
+                parent $id1;
+                children ["leading text", $id3];
+            };
+            layer root $id4 {
+                type "mui" Divider;
+                props {};
+                parent null;
+                children [];
+            };
+        };
+    };
+    """,
+    # Unicode identifiers, unicode escapes, keyword-like names and odd strings
+    """
+    dsl {component Überschrift(größe,\\u0061lpha,_under,layers){layer root
+    $wurzel{type "custom" Überschrift;props{"größe"=prop größe,"\\u0061lpha"=
+    prop \\u0061lpha,"_under"=prop _under,"layers"=prop layers};parent null;
+    children["$id1","children","{ [ , ; ] }",prop layers,$kind_1];};layer
+    $kind_1{type "mui" Typography;props{"text"="multi
+    line"};parent $wurzel;children[];};};};
+    """,
+)
+
+
+def generate(
+    components: int = 1, layers: int = 1, breadth: int = 4, children: int = 0
+) -> str:
+    """
+    Generates a synthetic DSL string
+
+    Every component has a root layer and `layers` non-root layers arranged as
+    a tree in which every layer has up to `breadth` child layers, followed by
+    `children` text children; a breadth of 1 nests every layer in the previous one
+
+    Args:
+        components (int, optional): number of components. Defaults to 1.
+        layers (int, optional): number of non-root layers per component. Defaults to 1.
+        breadth (int, optional): number of child layers per layer. Defaults to 4.
+        children (int, optional): number of text children per layer. Defaults to 0.
+
+    Returns:
+        str: The generated DSL string
+    """
+    text_children = "".join(f'"cell {index}",' for index in range(children))
+    parts: list[str] = ["dsl {\n"]
+    for component_index in range(components):
+        parts.append(f"component Component{component_index}(title) {{\n")
+        for layer_index in range(layers + 1):
+            root = "root " if layer_index == 0 else ""
+            parent = f"$id{(layer_index - 1) // breadth}" if layer_index > 0 else "null"
+            first_child = layer_index * breadth + 1
+            child_layers = "".join(
+                f"$id{index},"
+                for index in range(first_child, min(first_child + breadth, layers + 1))
+            )
+            parts.append(
+                f"layer {root}$id{layer_index} {{\n"
+                f'type "mui" Box;\n'
+                f'props {{"index" = {layer_index}, "label" = prop title, '
+                f'"sx" = {{"padding" = 1.5, "flags" = [true, null]}}}};\n'
+                f"parent {parent};\n"
+                f"children [{child_layers}{text_children}];\n"
+                f"}};\n"
+            )
+        parts.append("};\n")
+    parts.append("};\n")
+    return "".join(parts)
@@ -1,9 +1,13 @@
 """The decoder for the DSL"""
-from antlr4 import InputStream, CommonTokenStream
+from antlr4 import InputStream, CommonTokenStream, PredictionMode
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 
 from ..dsl import DSL
 
 from .visitor import Visitor
+from .parser import Parser
 
 from .errors import DecodeError
 
@@ -11,8 +15,54 @@ from .lib.PCParser import PCParser
 from .lib.PCLexer import PCLexer
 
 
-def decode(dsl: str) -> DSL:
-    """Decodes a DSL string"""
+backends = ("antlr", "descent")
+
+
+def decode(dsl: str, backend: str = "antlr") -> DSL:
+    """
+    Decodes a DSL string
+
+    Args:
+        dsl (str): The DSL string to be decoded
+        backend (str, optional): "antlr" to decode with the generated ANTLR
+        lexer and parser, "descent" to decode with the hand-written
+        recursive-descent parser. Both produce equal DSL objects for valid
+        DSL strings; only the ANTLR backend recovers from syntax errors.
+        Defaults to "antlr".
+
+    Raises:
+        ValueError: If the backend isn't one of the supported backends
+        DecodeError: If any stage of decoding fails
+
+    Returns:
+        DSL: The decoded DSL
+    """
+    if backend == "antlr":
+        decoded_dsl, _ = decode_with_mode(dsl)
+        return decoded_dsl
+    if backend == "descent":
+        return _decode_descent(dsl)
+    raise ValueError(f"Unknown decoder backend {backend!r}, expected one of {backends}")
+
+
+def decode_with_mode(dsl: str) -> tuple[DSL, PredictionMode]:
+    """
+    Decodes a DSL string and reports the prediction mode the parse succeeded with
+
+    The DSL is first parsed in SLL mode with a bail-out error strategy, which is
+    enough for almost every document; only when that fails is it re-parsed in
+    full LL mode with the default error recovery
+
+    Args:
+        dsl (str): The DSL string to be decoded
+
+    Raises:
+        DecodeError: If any stage of decoding fails
+
+    Returns:
+        tuple[DSL, PredictionMode]: The decoded DSL and the prediction mode
+        (PredictionMode.SLL or PredictionMode.LL) that produced it
+    """
     # Create a lexer and perform lexical analysis
     try:
         lexer_instance = PCLexer(input=InputStream(dsl))
@@ -30,7 +80,7 @@ def decode(dsl: str) -> DSL:
     # Create a parser and fetch the DSL context tree
     try:
         parser_instance = PCParser(input=token_stream)
-        dsl_context_tree = parser_instance.dsl()  # type: ignore
+        dsl_context_tree, prediction_mode = _parse(parser_instance)
     except Exception as exc:
         raise DecodeError(
             "An error occurred while building the abstract syntax tree from the DSL"
@@ -43,4 +93,36 @@ def decode(dsl: str) -> DSL:
         raise DecodeError(
             "An error occurred while walking abstract syntax tree from the DSL "
         ) from exc
-    return visitor_instance.dsl
+    return visitor_instance.dsl, prediction_mode
+
+
+def _decode_descent(dsl: str) -> DSL:
+    parser_instance = Parser(source=dsl)
+    try:
+        parser_instance.parse()
+    except DecodeError:
+        raise
+    except Exception as exc:
+        raise DecodeError(
+            "An error occurred while building the DSL with the recursive-descent parser"
+        ) from exc
+    return parser_instance.dsl
+
+
+def _parse(parser: PCParser) -> tuple[PCParser.DslContext, PredictionMode]:
+    # Stage 1: SLL prediction, bailing out on the first syntax error
+    # pylint: disable=[protected-access]
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    try:
+        return parser.dsl(), PredictionMode.SLL  # type: ignore
+    except ParseCancellationException:
+        pass
+
+    # Stage 2: rewind and re-parse with full LL prediction and error recovery
+    parser.reset()
+    parser._interp.predictionMode = PredictionMode.LL
+    parser._errHandler = DefaultErrorStrategy()
+    parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+    return parser.dsl(), PredictionMode.LL  # type: ignore
@@ -0,0 +1,302 @@
+"""The recursive-descent parser for the DSL"""
+
+
+from typing import Iterator, Optional, TypeAlias
+
+from ..dsl import DSL
+from ..layer import Layer
+from ..component import Component
+from ..identifier import Identifier
+from ..prop_reference import PropReference
+
+from ..errors import IdentifierNotFoundError
+
+from .errors import DecodeError
+from .tokenizer import Token, tokenize, location
+
+# (name, is_root, import library, import name, props, parent, children)
+LayerRecord: TypeAlias = tuple[
+    str,
+    bool,
+    str,
+    str,
+    dict[str, Layer.Value],
+    Optional[str],
+    list[tuple[str, Layer.Child]],
+]
+
+
+class Parser:
+    """
+    The recursive-descent parser for the DSL
+
+    Builds DSL, Component and Layer objects directly from the tokens, without
+    a parse tree, producing the same objects as the ANTLR backend does
+    """
+
+    def __init__(self, source: str) -> None:
+        """Initialise a Parser object
+
+        Args:
+            source (str): DSL string to parse
+        """
+        self._dsl: Optional[DSL] = None
+        self._source: str = source
+        self._tokens: list[Token] = []
+        self._position: int = 0
+
+    @property
+    def dsl(self) -> Optional[DSL]:
+        """
+        The DSL generated by parsing the source
+
+        Returns:
+            DSL: The DSL generated by parsing the source
+        """
+        return self._dsl
+
+    def parse(self) -> None:
+        """
+        Tokenizes and parses the source and generates a DSL object
+
+        Raises:
+            DecodeError: If the source isn't a syntactically valid DSL
+        """
+        self._tokens = tokenize(self._source)
+        self._position = 0
+        self.__parse_DSL()
+
+    # pylint: disable=[invalid-name]
+    def __parse_DSL(self) -> None:
+        # Create a DSL
+        self._dsl = DSL()
+        self.__expect("DSL")
+        self.__expect("OPEN_BRACE")
+        # Parse the components
+        self.__parse_Component()
+        while self.__peek() == "COMPONENT":
+            self.__parse_Component()
+        self.__expect("CLOSE_BRACE")
+        self.__expect("SEMICOLON")
+
+    # pylint: disable=[invalid-name]
+    def __parse_Component(self) -> None:
+        # Create a Component using the name and attach it to the DSL
+        self.__expect("COMPONENT")
+        component = Component(name=self.__expect("IDENTIFIER"))
+        self._dsl.add_component(component=component)
+
+        # Attach the props
+        self.__expect("OPEN_PARANTHESIS")
+        if self.__peek() == "IDENTIFIER":
+            component.add_prop(identifier=Identifier.of(self.__expect("IDENTIFIER")))
+            while self.__accept("COMMA"):
+                component.add_prop(
+                    identifier=Identifier.of(self.__expect("IDENTIFIER"))
+                )
+        self.__expect("CLOSE_PARANTHESIS")
+
+        # Parse the layers
+        self.__expect("OPEN_BRACE")
+        records: list[LayerRecord] = [self.__parse_Layer()]
+        while self.__peek() == "LAYER":
+            records.append(self.__parse_Layer())
+        self.__expect("CLOSE_BRACE")
+        self.__expect("SEMICOLON")
+
+        # Build the layers starting from the root layers, the first layer
+        # with a given name being the one referenced as a child
+        index: dict[str, LayerRecord] = {}
+        for record in records:
+            index.setdefault(record[0], record)
+        for record in records:
+            if record[1]:
+                self.__build_Layer(component, record, index)
+
+    # pylint: disable=[invalid-name]
+    def __parse_Layer(self) -> LayerRecord:
+        self.__expect("LAYER")
+        is_root = self.__accept("ROOT")
+        name = self.__expect("IDENTIFIER")
+        self.__expect("OPEN_BRACE")
+        # type statement
+        self.__expect("TYPE")
+        import_library = self.__expect("STRING")
+        import_name = self.__expect("IDENTIFIER")
+        self.__expect("SEMICOLON")
+        # props statement
+        self.__expect("PROPS")
+        self.__expect("OPEN_BRACE")
+        props = self.__parse_Object()
+        self.__expect("SEMICOLON")
+        # parent statement
+        self.__expect("PARENT")
+        parent: Optional[str] = None
+        if not self.__accept("NULL"):
+            parent = self.__expect("IDENTIFIER")
+        self.__expect("SEMICOLON")
+        # children statement
+        self.__expect("CHILDREN")
+        self.__expect("OPEN_BRACKET")
+        children = self.__parse_Children()
+        self.__expect("SEMICOLON")
+
+        self.__expect("CLOSE_BRACE")
+        self.__expect("SEMICOLON")
+        return (name, is_root, import_library, import_name, props, parent, children)
+
+    # pylint: disable=[invalid-name]
+    def __parse_Children(self) -> list[tuple[str, Layer.Child]]:
+        children: list[tuple[str, Layer.Child]] = []
+        if self.__accept("CLOSE_BRACKET"):
+            return children
+        while True:
+            token_type, text, offset = self.__advance()
+            if token_type == "IDENTIFIER":
+                children.append((token_type, text))
+            elif token_type == "STRING":
+                children.append((token_type, text.strip('"')))
+            elif token_type == "PROP":
+                children.append((token_type, self.__parse_PropReference()))
+            else:
+                self.__raise_unexpected("a child", text, offset)
+            if self.__accept("CLOSE_BRACKET"):
+                return children
+            self.__expect("COMMA")
+            if self.__accept("CLOSE_BRACKET"):
+                return children
+
+    # pylint: disable=[invalid-name]
+    def __build_Layer(
+        self, component: Component, record: LayerRecord, index: dict[str, LayerRecord]
+    ) -> None:
+        # Build the layer tree with an explicit work stack instead of recursing,
+        # each entry holding a layer and an iterator over its unbuilt children
+        stack: list[tuple[Layer, Iterator[tuple[str, Layer.Child]]]] = [
+            (self.__create_Layer(component, record), iter(record[6]))
+        ]
+        while stack:
+            layer, children = stack[-1]
+            for child_type, child in children:
+                if child_type != "IDENTIFIER":
+                    layer.add_child(child)
+                    continue
+                # Build the child layer before the remaining children
+                if child not in index:
+                    raise IdentifierNotFoundError(
+                        "There is no layer with the provided identifier in the component"
+                    )
+                child_record = index[child]
+                stack.append(
+                    (
+                        self.__create_Layer(component, child_record),
+                        iter(child_record[6]),
+                    )
+                )
+                break
+            else:
+                stack.pop()
+
+    # pylint: disable=[invalid-name]
+    def __create_Layer(self, component: Component, record: LayerRecord) -> Layer:
+        name, is_root, import_library, import_name, props, parent, _ = record
+        # Create a layer and attach it to the Component
+        layer = Layer(name=name)
+        component.add_layer(layer=layer)
+        layer.is_root = is_root
+
+        # Attach the import name, library and props
+        layer.import_name = Identifier.of(import_name)
+        layer.import_library = import_library.strip('"')
+        layer.props = props
+
+        # Attach the parent layer
+        if not is_root:
+            if parent is None:
+                raise IdentifierNotFoundError(
+                    "There is no layer with the provided identifier in the component"
+                )
+            layer.parent = Identifier.of(parent)
+        return layer
+
+    # pylint: disable=[invalid-name]
+    def __parse_Object(self) -> dict[str, Layer.Value]:
+        obj: dict[str, Layer.Value] = {}
+        if self.__accept("CLOSE_BRACE"):
+            return obj
+        while True:
+            key = self.__expect("STRING").strip('"')
+            self.__expect("EQUALS")
+            obj[key] = self.__parse_Value()
+            if self.__accept("CLOSE_BRACE"):
+                return obj
+            self.__expect("COMMA")
+            if self.__accept("CLOSE_BRACE"):
+                return obj
+
+    # pylint: disable=[invalid-name]
+    def __parse_Array(self) -> list[Layer.Value]:
+        arr: list[Layer.Value] = []
+        if self.__accept("CLOSE_BRACKET"):
+            return arr
+        while True:
+            arr.append(self.__parse_Value())
+            if self.__accept("CLOSE_BRACKET"):
+                return arr
+            self.__expect("COMMA")
+            if self.__accept("CLOSE_BRACKET"):
+                return arr
+
+    # pylint: disable=[invalid-name]
+    def __parse_Value(self) -> Layer.Value:
+        token_type, text, offset = self.__advance()
+        if token_type == "STRING":
+            return text.strip('"')
+        if token_type == "NUMBER":
+            if "." in text:
+                return float(text)
+            return int(text)
+        if token_type == "BOOLEAN":
+            return text == "true"
+        if token_type == "NULL":
+            return None
+        if token_type == "OPEN_BRACE":
+            return self.__parse_Object()
+        if token_type == "OPEN_BRACKET":
+            return self.__parse_Array()
+        if token_type == "PROP":
+            return self.__parse_PropReference()
+        return self.__raise_unexpected("a value", text, offset)
+
+    # pylint: disable=[invalid-name]
+    def __parse_PropReference(self) -> PropReference:
+        return PropReference(Identifier.of(self.__expect("IDENTIFIER")))
+
+    def __peek(self) -> str:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position][0]
+        return "EOF"
+
+    def __advance(self) -> Token:
+        if self._position < len(self._tokens):
+            token = self._tokens[self._position]
+            self._position += 1
+            return token
+        return ("EOF", "<EOF>", len(self._source))
+
+    def __accept(self, token_type: str) -> bool:
+        if self.__peek() == token_type:
+            self._position += 1
+            return True
+        return False
+
+    def __expect(self, token_type: str) -> str:
+        found_type, text, offset = self.__advance()
+        if found_type != token_type:
+            self.__raise_unexpected(token_type, text, offset)
+        return text
+
+    def __raise_unexpected(self, expected: str, text: str, offset: int) -> None:
+        raise DecodeError(
+            f"Expected {expected} but found {text!r} at {location(self._source, offset)}"
+        )
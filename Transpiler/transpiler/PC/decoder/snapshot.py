@@ -0,0 +1,210 @@
+"""The snapshot of the deserialized ATN and warmed-up DFA of the generated lexer and parser
+
+PCLexer and PCParser deserialize their ATN when imported and start with empty
+DFA caches in every new process. `build_snapshot` pickles both after warming
+up the DFA, and `load_snapshot` installs the pickled state on the generated
+classes, leaving them untouched when the snapshot is missing or stale. Loaded
+before the generated modules are imported, the snapshot also spares their
+ATN deserialization.
+
+Build the snapshot with `make decoder-snapshot`, when installing or building
+the image of the service; the service itself never writes it
+"""
+
+from contextlib import contextmanager
+from hashlib import blake2b
+from io import BytesIO
+from os import stat
+from os.path import dirname, join
+from pickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+from sys import getrecursionlimit, setrecursionlimit, version_info
+from typing import Any, Iterator, Optional
+
+import antlr4
+from antlr4.atn.ATN import ATN
+from antlr4.atn.ATNDeserializer import ATNDeserializer
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.PredictionContext import PredictionContext
+
+snapshot_path = join(dirname(__file__), "lib", "PC.snapshot")
+# The generated modules holding the serialized ATNs, read without importing them
+generated_paths = (
+    join(dirname(__file__), "lib", "PCLexer.py"),
+    join(dirname(__file__), "lib", "PCParser.py"),
+)
+
+# Runtime singletons compared by identity, pickled by name
+singletons: dict[str, Any] = {
+    "ATNSimulator.ERROR": ATNSimulator.ERROR,
+    "LexerATNSimulator.ERROR": LexerATNSimulator.ERROR,
+    "PredictionContext.EMPTY": PredictionContext.EMPTY,
+    "SemanticContext.NONE": SemanticContext.NONE,
+}
+singleton_names: dict[int, str] = {
+    id(value): name for name, value in singletons.items()
+}
+
+
+class SnapshotPickler(Pickler):
+    """Pickler keeping the ANTLR runtime singletons out of the snapshot"""
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return singleton_names.get(id(obj))
+
+
+class SnapshotUnpickler(Unpickler):
+    """Unpickler restoring the ANTLR runtime singletons of the snapshot"""
+
+    def persistent_load(self, pid: Any) -> Any:
+        return singletons[pid]
+
+
+def snapshot_key() -> bytes:
+    """
+    The key identifying the grammar, runtime and interpreter a snapshot was built for
+
+    Returns:
+        bytes: digest of the generated modules, the runtime install and the Python version
+    """
+    runtime = stat(antlr4.__file__)
+    digest = blake2b(digest_size=16)
+    for path in generated_paths:
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    digest.update(f"{antlr4.__file__}:{runtime.st_size}:{runtime.st_mtime_ns}".encode())
+    digest.update(repr(version_info[:2]).encode())
+    return digest.digest()
+
+
+def atn_key(serialized_atn: list[int]) -> bytes:
+    """
+    The key identifying the ATN deserialized from a serialized ATN
+
+    Args:
+        serialized_atn (list[int]): The serialized ATN
+
+    Returns:
+        bytes: digest of the serialized ATN
+    """
+    return blake2b(repr(serialized_atn).encode(), digest_size=16).digest()
+
+
+@contextmanager
+def deserializing_from(atns: dict[bytes, ATN]) -> Iterator[None]:
+    """
+    Makes ATNDeserializer.deserialize return the provided ATNs, by the key of
+    their serialized ATN, while in the context; other serialized ATNs are
+    deserialized as usual
+
+    The patch is process-wide, so it is restored on exit, including when
+    the body of the context raises
+
+    Args:
+        atns (dict[bytes, ATN]): The ATNs, by the atn_key of their serialized ATN
+    """
+    deserialize = ATNDeserializer.deserialize
+
+    def deserialize_from_snapshot(
+        deserializer: ATNDeserializer, data: list[int]
+    ) -> ATN:
+        atn = atns.get(atn_key(data))
+        return deserialize(deserializer, data) if atn is None else atn
+
+    ATNDeserializer.deserialize = deserialize_from_snapshot
+    try:
+        yield
+    finally:
+        ATNDeserializer.deserialize = deserialize
+
+
+def build_snapshot(path: str = snapshot_path) -> None:
+    """
+    Warms up the DFA with the corpus, then writes the snapshot
+
+    Args:
+        path (str, optional): The file to write the snapshot to. Defaults to snapshot_path.
+    """
+    # pylint: disable=[import-outside-toplevel]
+    from .lib import PCLexer, PCParser
+    from .lib.PCLexer import serializedATN as serialized_lexer_atn
+    from .lib.PCParser import serializedATN as serialized_parser_atn
+    from .warmup import warmup
+
+    warmup()
+
+    state = (
+        atn_key(serialized_lexer_atn()),
+        PCLexer.atn,
+        PCLexer.decisionsToDFA,
+        atn_key(serialized_parser_atn()),
+        PCParser.atn,
+        PCParser.decisionsToDFA,
+        PCParser.sharedContextCache,
+    )
+    buffer = BytesIO()
+    # The ATN is a deeply linked graph, pickling it recurses along its transitions
+    recursion_limit = getrecursionlimit()
+    setrecursionlimit(max(recursion_limit, 20000))
+    try:
+        pickler = SnapshotPickler(buffer, protocol=HIGHEST_PROTOCOL)
+        pickler.dump(snapshot_key())
+        pickler.dump(state)
+    finally:
+        setrecursionlimit(recursion_limit)
+    with open(path, "wb") as file:
+        file.write(buffer.getvalue())
+
+
+def load_snapshot(path: str = snapshot_path) -> bool:
+    """
+    Installs the snapshot on PCLexer and PCParser, unless it is missing or stale
+
+    Must run before any PCLexer or PCParser is created, as they capture the
+    DFA of their class when initialised. Run before the generated modules are
+    imported, it imports them with the ATNs of the snapshot rather than
+    deserializing theirs
+
+    Args:
+        path (str, optional): The file to read the snapshot from. Defaults to snapshot_path.
+
+    Returns:
+        bool: whether the snapshot was installed
+    """
+    try:
+        with open(path, "rb") as file:
+            unpickler = SnapshotUnpickler(file)
+            # Check the key before unpickling a possibly incompatible state
+            if unpickler.load() != snapshot_key():
+                return False
+            state = unpickler.load()
+        (
+            lexer_key,
+            lexer_atn,
+            lexer_dfa,
+            parser_key,
+            parser_atn,
+            parser_dfa,
+            parser_context_cache,
+        ) = state
+        if len(lexer_dfa) != len(lexer_atn.decisionToState) or len(parser_dfa) != len(
+            parser_atn.decisionToState
+        ):
+            return False
+    # pylint: disable=[broad-except]
+    except Exception:
+        return False
+
+    # The generated classes deserialize their ATN in their class body, hand
+    # them the ATNs of the snapshot instead, checking they are the same ATNs
+    with deserializing_from({lexer_key: lexer_atn, parser_key: parser_atn}):
+        # pylint: disable=[import-outside-toplevel]
+        from .lib import PCLexer, PCParser
+
+    PCLexer.atn = lexer_atn
+    PCLexer.decisionsToDFA = lexer_dfa
+    PCParser.atn = parser_atn
+    PCParser.decisionsToDFA = parser_dfa
+    PCParser.sharedContextCache = parser_context_cache
+    return True
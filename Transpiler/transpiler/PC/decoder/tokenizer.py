@@ -0,0 +1,101 @@
+"""The tokenizer for the recursive-descent decoder"""
+
+from typing import TypeAlias
+
+from regex import compile as regex_compile, DOTALL
+
+from .errors import DecodeError
+
+# A token is a (type, text, offset) triple, the types being the token names of PC.g4
+Token: TypeAlias = tuple[str, str, int]
+
+# RegEx for the IDENTIFIER lexer rule
+regex_hex_digit = r"[_0-9a-fA-F]"
+regex_unicode_escape_sequence = (
+    rf"\\u(?:{regex_hex_digit}{{4}}|\{{{regex_hex_digit}{regex_hex_digit}+\}})"
+)
+regex_identifier_start = rf"(?:[\p{{L}}$_]|{regex_unicode_escape_sequence})"
+regex_identifier_part = (
+    rf"(?:{regex_identifier_start}|[\p{{Mn}}\p{{Nd}}\p{{Pc}}\u200C\u200D])"
+)
+
+# The alternatives start with disjoint characters, so the first match is the longest
+token_pattern = regex_compile(
+    r"(?P<WHITESPACE>[\t\n\r ]+)"
+    r'|(?P<STRING>".+?")'
+    r"|(?P<NUMBER>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[Ee][+\-]?(?:0|[1-9][0-9]*))?)"
+    rf"|(?P<IDENTIFIER>{regex_identifier_start}{regex_identifier_part}*)"
+    r"|(?P<OPEN_BRACE>\{)"
+    r"|(?P<CLOSE_BRACE>\})"
+    r"|(?P<OPEN_BRACKET>\[)"
+    r"|(?P<CLOSE_BRACKET>\])"
+    r"|(?P<OPEN_PARANTHESIS>\()"
+    r"|(?P<CLOSE_PARANTHESIS>\))"
+    r"|(?P<EQUALS>=)"
+    r"|(?P<COMMA>,)"
+    r"|(?P<SEMICOLON>;)"
+    r"|(?P<MISMATCH>.)",
+    DOTALL,
+)
+
+# Keywords take precedence over IDENTIFIER when the whole token matches
+keywords: dict[str, str] = {
+    "dsl": "DSL",
+    "component": "COMPONENT",
+    "layer": "LAYER",
+    "root": "ROOT",
+    "type": "TYPE",
+    "props": "PROPS",
+    "parent": "PARENT",
+    "children": "CHILDREN",
+    "prop": "PROP",
+    "null": "NULL",
+    "true": "BOOLEAN",
+    "false": "BOOLEAN",
+}
+
+
+def tokenize(dsl: str) -> list[Token]:
+    """
+    Performs lexical analysis on a DSL string in a single pass
+
+    Args:
+        dsl (str): The DSL string to be tokenized
+
+    Raises:
+        DecodeError: If a character doesn't start any token
+
+    Returns:
+        list[Token]: The tokens of the DSL, whitespace excluded
+    """
+    tokens: list[Token] = []
+    append = tokens.append
+    for match in token_pattern.finditer(dsl):
+        token_type = match.lastgroup
+        if token_type == "WHITESPACE":
+            continue
+        text = match.group()
+        if token_type == "IDENTIFIER":
+            token_type = keywords.get(text, token_type)
+        elif token_type == "MISMATCH":
+            raise DecodeError(
+                f"Unexpected character {text!r} at {location(dsl, match.start())}"
+            )
+        append((token_type, text, match.start()))
+    return tokens
+
+
+def location(dsl: str, offset: int) -> str:
+    """
+    Formats an offset of a DSL string as a line and column
+
+    Args:
+        dsl (str): The DSL string
+        offset (int): The offset into the DSL string
+
+    Returns:
+        str: The location as "line <line>:<column>"
+    """
+    line = dsl.count("\n", 0, offset) + 1
+    column = offset - (dsl.rfind("\n", 0, offset) + 1)
+    return f"line {line}:{column}"
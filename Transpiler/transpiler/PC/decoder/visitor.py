@@ -1,9 +1,10 @@
 """The visitor for the AST"""
 
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from antlr4 import ParseTreeVisitor
+from antlr4 import ParseTreeVisitor, TerminalNode
+from antlr4.tree.Tree import ParseTree
 
 from ..dsl import DSL
 from ..layer import Layer
@@ -30,6 +31,7 @@ class Visitor(ParseTreeVisitor):
         self._tree: PCParser.DslContext = tree
         self._active_component: Component = None
         self._active_component_context: PCParser.ComponentContext = None
+        self._active_layer_contexts: dict[str, PCParser.LayerContext] = {}
 
     @property
     def dsl(self) -> Optional[DSL]:
@@ -68,10 +70,15 @@ class Visitor(ParseTreeVisitor):
         # Attach the props
         propnames = [str(prop) for prop in context.IDENTIFIER()][1:]
         for propname in propnames:
-            component.add_prop(identifier=Identifier(propname))
+            component.add_prop(identifier=Identifier.of(propname))
         # Walk the layers
         # Get all the layers
         layers: list[PCParser.LayerContext] = context.layer()
+        # Index the layers by identifier, the first layer with a given
+        # identifier being the one referenced as a child
+        self._active_layer_contexts = {}
+        for layer in layers:
+            self._active_layer_contexts.setdefault(str(layer.IDENTIFIER()), layer)
         # Filter out root layers
         root_layers: list[PCParser.LayerContext] = [
             layer for layer in layers if layer.ROOT() is not None
@@ -81,6 +88,26 @@ class Visitor(ParseTreeVisitor):
 
     # pylint: disable=[invalid-name]
     def __visit_Layer(self, context: PCParser.LayerContext) -> None:
+        # Walk the layer tree with an explicit work stack instead of recursing,
+        # each entry holding a layer and an iterator over its unvisited children
+        stack: list[tuple[Layer, Iterator[ParseTree]]] = [
+            (self.__create_Layer(context), context.childLayers().getChildren())
+        ]
+        while stack:
+            layer, children = stack[-1]
+            child_layer_context = self.__visit_Children(layer=layer, children=children)
+            if child_layer_context is None:
+                stack.pop()
+            else:
+                stack.append(
+                    (
+                        self.__create_Layer(child_layer_context),
+                        child_layer_context.childLayers().getChildren(),
+                    )
+                )
+
+    # pylint: disable=[invalid-name]
+    def __create_Layer(self, context: PCParser.LayerContext) -> Layer:
         # Create a layer using the id
         name = str(context.IDENTIFIER())
         layer = Layer(name=name)
@@ -94,7 +121,7 @@ class Visitor(ParseTreeVisitor):
 
         # Attach the import name and library
         type_context: PCParser.TypeContext = context.type_()
-        layer.import_name = Identifier(str(type_context.IDENTIFIER()))
+        layer.import_name = Identifier.of(str(type_context.IDENTIFIER()))
         layer.import_library = str(type_context.STRING()).strip('"')
 
         # Attach the props
@@ -105,39 +132,41 @@ class Visitor(ParseTreeVisitor):
             parent_context: PCParser.ParentLayerContext = context.parentLayer()
             parent_layer_identifier: str = str(parent_context.IDENTIFIER())
             if parent_layer_identifier != "null":
-                layer.parent = Identifier(parent_layer_identifier)
-
-        # Visit the children
-        children_context: PCParser.ChildLayersContext = context.childLayers()
-        self.__visit_Children(layer=layer, context=children_context)
+                layer.parent = Identifier.of(parent_layer_identifier)
+        return layer
 
     # pylint: disable=[invalid-name]
     def __visit_Children(
-        self, layer: Layer, context: PCParser.ChildLayersContext
-    ) -> None:
-        string_child_nodes = [str(child) for child in context.STRING()]
-        identifier_child_nodes = [str(child) for child in context.IDENTIFIER()]
-
-        for child in context.getChildren():
+        self, layer: Layer, children: Iterator[ParseTree]
+    ) -> Optional[PCParser.LayerContext]:
+        # Attach children until a child layer is met, which is returned to be
+        # visited before the remaining children
+        for child in children:
             # Attach prop references
             if isinstance(child, PCParser.PropReferenceContext):
-                prop = PropReference(Identifier(str(child.IDENTIFIER())))
+                prop = PropReference(Identifier.of(str(child.IDENTIFIER())))
                 layer.add_child(prop)
-            # Attach strings and identifiers
-            child_stringified = str(child)
-            if child_stringified in string_child_nodes:
-                layer.add_child(child_stringified.strip('"'))
-            elif child_stringified in identifier_child_nodes:
-                child_layer_context = self.__fetch_LayerContext(id=child_stringified)
-                self.__visit_Layer(context=child_layer_context)
+                continue
+            # Skip the rule contexts, only tokens remain
+            if not isinstance(child, TerminalNode):
+                continue
+            # Attach strings and identifiers, classified by token type
+            token = child.getSymbol()
+            if token.type == PCParser.STRING:
+                layer.add_child(token.text.strip('"'))
+            elif token.type == PCParser.IDENTIFIER:
+                child_layer_context = self.__fetch_LayerContext(id=token.text)
+                if child_layer_context is None:
+                    raise IdentifierNotFoundError(
+                        "There is no layer with the provided identifier in the component"
+                    )
+                return child_layer_context
+        return None
 
     # pylint: disable=[invalid-name]
-    def __fetch_LayerContext(self, id: str) -> PCParser.LayerContext:
+    def __fetch_LayerContext(self, id: str) -> Optional[PCParser.LayerContext]:
         # Layers belonging to the active component
-        layers: list[PCParser.LayerContext] = self._active_component_context.layer()
-        for layer in layers:
-            if id == str(layer.IDENTIFIER()):
-                return layer
+        return self._active_layer_contexts.get(id)
 
     # pylint: disable=[invalid-name]
     def __visit_Props(self, layer: Layer, context: PCParser.PropsContext) -> None:
@@ -194,4 +223,4 @@ class Visitor(ParseTreeVisitor):
 
     # pylint: disable=[invalid-name]
     def __visit_PropReference(self, context: PCParser.PropReferenceContext):
-        return PropReference(Identifier(str(context.IDENTIFIER())))
+        return PropReference(Identifier.of(str(context.IDENTIFIER())))
@@ -0,0 +1,50 @@
+"""Warm-up of the DFA shared by the generated lexers and parsers"""
+
+from typing import Iterable, Optional
+
+from antlr4 import InputStream, CommonTokenStream, PredictionMode
+
+from .corpus import documents as corpus_documents, generate
+from .lib.PCParser import PCParser
+from .lib.PCLexer import PCLexer
+
+
+def warmup(documents: Optional[Iterable[str]] = None) -> tuple[int, int]:
+    """
+    Feeds documents through the lexer and the parser, in both SLL and LL
+    prediction modes, so that decoding later DSL strings finds the
+    prediction caches shared by every PCLexer and PCParser populated
+
+    Args:
+        documents (Optional[Iterable[str]], optional): The DSL strings to feed.
+        Defaults to the decoder corpus and a synthetic document.
+
+    Returns:
+        tuple[int, int]: the number of lexer and parser DFA states after warming up
+    """
+    if documents is None:
+        documents = (*corpus_documents, generate(components=2, layers=32, children=2))
+    for document in documents:
+        token_stream = CommonTokenStream(lexer=PCLexer(input=InputStream(document)))
+        parser_instance = PCParser(input=token_stream)
+        parser_instance.removeErrorListeners()
+        for prediction_mode in (PredictionMode.SLL, PredictionMode.LL):
+            parser_instance.reset()
+            # pylint: disable=[protected-access]
+            parser_instance._interp.predictionMode = prediction_mode
+            parser_instance.dsl()
+    return dfa_state_counts()
+
+
+def dfa_state_counts() -> tuple[int, int]:
+    """
+    The number of DFA states cached by the generated lexer and parser
+
+    Returns:
+        tuple[int, int]: the number of lexer and parser DFA states
+    """
+    # pylint: disable=[protected-access]
+    return (
+        sum(len(dfa._states) for dfa in PCLexer.decisionsToDFA),
+        sum(len(dfa._states) for dfa in PCParser.decisionsToDFA),
+    )
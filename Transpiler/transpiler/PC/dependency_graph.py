@@ -0,0 +1,159 @@
+"""DependencyGraph for ".pc" DSL"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+
+from .errors import CyclicReferenceError, IdentifierNotFoundError
+
+if TYPE_CHECKING:
+    from .dsl import DSL  # pragma: no cover
+    from .identifier import Identifier  # pragma: no cover
+
+
+class DependencyGraph:
+    """
+    Represents the references between the components of a ".pc" DSL object
+
+    A component depends on the components its layers import with the "custom"
+    library; references to components missing from the DSL are left out.
+    The graph is a snapshot of the DSL when it was built
+    """
+
+    def __init__(self, dsl: DSL) -> None:
+        """
+        Initialise a DependencyGraph object, in time linear in the number of
+        components and custom layers of the DSL
+
+        Args:
+            dsl (DSL): The DSL object to build the graph of
+        """
+        # Ordered sets of identifiers, in the order of the components in the DSL
+        self._dependencies: dict[Identifier, dict[Identifier, None]] = {}
+        self._dependents: dict[Identifier, dict[Identifier, None]] = {}
+        for component in dsl.components:
+            self._dependencies[component.identifier] = {}
+            self._dependents[component.identifier] = {}
+        for component in dsl.components:
+            # pylint: disable=[protected-access]
+            for referencing, _ in dsl._references.get(component.identifier, {}):
+                self._dependencies[referencing][component.identifier] = None
+                self._dependents[component.identifier][referencing] = None
+        self._levels: Optional[list[list[Identifier]]] = None
+        self._cycle: Optional[list[Identifier]] = None
+
+    @property
+    def components(self) -> list[Identifier]:
+        """
+        The components of the graph
+
+        Returns:
+            list[Identifier]: The identifiers of the components, in the order of the DSL
+        """
+        return [*self._dependencies]
+
+    def get_dependencies(self, identifier: Identifier) -> list[Identifier]:
+        """
+        get the components a component imports
+
+        Args:
+            identifier (Identifier): Identifier of the Component
+
+        Raises:
+            IdentifierNotFoundError: If there is no component matching with the provided Identifier
+
+        Returns:
+            list[Identifier]: The identifiers of the imported components
+        """
+        if identifier not in self._dependencies:
+            raise IdentifierNotFoundError(
+                "There is no matching component with the provided Identifier in the graph"
+            )
+        return [*self._dependencies[identifier]]
+
+    def get_dependents(self, identifier: Identifier) -> list[Identifier]:
+        """
+        get the components importing a component
+
+        Args:
+            identifier (Identifier): Identifier of the Component
+
+        Raises:
+            IdentifierNotFoundError: If there is no component matching with the provided Identifier
+
+        Returns:
+            list[Identifier]: The identifiers of the importing components
+        """
+        if identifier not in self._dependents:
+            raise IdentifierNotFoundError(
+                "There is no matching component with the provided Identifier in the graph"
+            )
+        return [*self._dependents[identifier]]
+
+    def find_cycle(self) -> Optional[list[Identifier]]:
+        """
+        Finds a cycle of references between components
+
+        Returns:
+            Optional[list[Identifier]]: The components of a cycle, starting and ending
+            with the same component, each importing the next, if there is any
+        """
+        self.__sort()
+        return None if self._cycle is None else [*self._cycle]
+
+    def levels(self) -> list[list[Identifier]]:
+        """
+        The components in topological levels: the components of a level only
+        import components of the previous levels, so those of a level can be
+        generated concurrently once the previous levels are
+
+        Raises:
+            CyclicReferenceError: If components reference each other in a cycle
+
+        Returns:
+            list[list[Identifier]]: The levels, each in the order of the DSL
+        """
+        self.__sort()
+        if self._cycle is not None:
+            raise CyclicReferenceError([*self._cycle])
+        return [[*level] for level in self._levels]
+
+    def __sort(self) -> None:
+        # Kahn's algorithm, level by level
+        if self._levels is not None:
+            return
+        remaining = {
+            identifier: len(dependencies)
+            for identifier, dependencies in self._dependencies.items()
+        }
+        level = [identifier for identifier, count in remaining.items() if count == 0]
+        levels: list[list[Identifier]] = []
+        while level:
+            levels.append(level)
+            next_level: list[Identifier] = []
+            for identifier in level:
+                del remaining[identifier]
+                for dependent in self._dependents[identifier]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.append(dependent)
+            level = next_level
+        self._levels = levels
+        # The components left over are in or depend on a cycle
+        if remaining:
+            self._cycle = self.__find_cycle(remaining)
+
+    def __find_cycle(self, remaining: dict[Identifier, int]) -> list[Identifier]:
+        # Every left over component imports another left over component,
+        # so following those imports from any of them ends up in a cycle
+        position: dict[Identifier, int] = {}
+        path: list[Identifier] = []
+        identifier = next(iter(remaining))
+        while identifier not in position:
+            position[identifier] = len(path)
+            path.append(identifier)
+            identifier = next(
+                dependency
+                for dependency in self._dependencies[identifier]
+                if dependency in remaining
+            )
+        return path[position[identifier] :] + [identifier]
@@ -0,0 +1,111 @@
+"""Structural digests of ".pc" DSL objects
+
+Equal objects have equal digests: the digest of a node only covers what its
+__eq__ compares, and ignores what __eq__ ignores, like the order of the
+children of a layer. Digests are stable across processes
+"""
+
+from hashlib import blake2b
+from numbers import Number
+from typing import Union
+
+from .identifier import Identifier
+from .prop_reference import PropReference
+
+digest_size = 16
+
+# The canonical form of a value: a tuple of a tag, and of strings, integers,
+# digests and other canonical forms. Its repr is unambiguous, so it is hashed
+Canonical = tuple[Union[str, int, bytes, "Canonical"], ...]
+
+
+def digest(tag: bytes, *parts: Union[Canonical, bytes]) -> bytes:
+    """
+    Digests a tagged sequence of parts
+
+    Args:
+        tag (bytes): The kind of node being digested
+        *parts (Union[Canonical, bytes]): The canonical forms and digests of the
+        parts of the node, in a canonical order
+
+    Returns:
+        bytes: The digest, prefixed with the tag
+    """
+    text = repr((tag, parts)).encode("utf-8", "surrogatepass")
+    return tag + blake2b(text, digest_size=digest_size).digest()
+
+
+def canonical_unordered(tag: str, parts: list) -> Canonical:
+    """
+    The canonical form of a tagged collection of parts, whatever their order
+
+    Args:
+        tag (str): The kind of collection
+        parts (list): The canonical forms or digests of the parts, in any order
+
+    Returns:
+        Canonical: The canonical form of the collection
+    """
+    parts.sort()
+    return (tag, *parts)
+
+
+def canonical_value(value: object) -> Canonical:
+    """
+    The canonical form of a value of a layer, or of an attribute of a node
+
+    Values equal with == have the same canonical form, like 1, 1.0 and True
+
+    Args:
+        value (object): The value
+
+    Returns:
+        Canonical: The canonical form of the value
+    """
+    if value is None:
+        return ("z",)
+    if isinstance(value, str):
+        return ("s", value)
+    if isinstance(value, dict):
+        # Keys of a dict are never equal to each other, so their canonical
+        # forms give the entries a canonical order
+        return canonical_unordered(
+            "d",
+            [
+                (canonical_value(key), canonical_value(item))
+                for key, item in value.items()
+            ],
+        )
+    if isinstance(value, list):
+        # Layer.__eq__ compares lists as multisets, see values_equal
+        return canonical_unordered("l", [canonical_value(item) for item in value])
+    if isinstance(value, Identifier):
+        return ("i", value.value)
+    if isinstance(value, PropReference):
+        return ("p", value.value.value)
+    if isinstance(value, int):
+        # Integers and booleans, without the slower check of Number
+        return ("n", int(value), 1)
+    if isinstance(value, Number):
+        return canonical_number(value)
+    return ("o", repr(value))
+
+
+def canonical_number(value: Number) -> Canonical:
+    """
+    The canonical form of a number, the same for equal numbers of different types
+
+    Args:
+        value (Number): The number
+
+    Returns:
+        Canonical: The canonical form of the number
+    """
+    if isinstance(value, complex) and value.imag == 0:
+        value = value.real
+    try:
+        numerator, denominator = value.as_integer_ratio()  # type: ignore
+    except (AttributeError, ValueError, OverflowError):
+        # Infinities, NaNs and numbers without an exact ratio
+        return ("o", repr(value))
+    return ("n", numerator, denominator)
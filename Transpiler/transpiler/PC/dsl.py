@@ -2,15 +2,18 @@
 
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
-
-from re import sub as regex_substitute
+from typing import TYPE_CHECKING, Iterable, Optional
 
+from .identifier import Identifier
+from .dependency_graph import DependencyGraph
+from .printer import Printer
+from .digest import digest, canonical_unordered
 from .errors import IdentifierNotFoundError, DuplicateIdentifierError
 
 if TYPE_CHECKING:
     from .component import Component  # pragma: no cover
-    from .identifier import Identifier  # pragma: no cover
+    from .layer import Layer  # pragma: no cover
+    from .frozen import FrozenDSL  # pragma: no cover
 
 
 class DSL:
@@ -19,18 +22,34 @@ class DSL:
     def __init__(self) -> None:
         """Initialise a DSL object"""
         self._components: dict[Identifier, Component] = {}
+        # The journal of modifications since it was last cleared:
+        # the modified components, mapped to None when modified as a whole or to
+        # their modified layers, and the components whose references are affected
+        self._dirty: dict[Identifier, Optional[dict[Identifier, None]]] = {}
+        self._dirty_dependencies: set[Identifier] = set()
+        # The custom layers by the identifier of the component they import,
+        # whether it is in the DSL or not, then by component and layer identifier
+        self._references: dict[
+            Identifier, dict[tuple[Identifier, Identifier], Layer]
+        ] = {}
+        self._digest: Optional[bytes] = None
 
     def __eq__(self, other: DSL) -> bool:
+        if self.digest != other.digest:
+            return False
         if self._components != other._components:
             return False
         return True
 
     def __str__(self) -> str:
-        return self.__stringify()
+        parts: list[str] = []
+        Printer(parts.append, pretty=True).print_dsl(self)
+        return "".join(parts)
 
     def __repr__(self) -> str:
-        component_string = self.__stringify()
-        return regex_substitute(r"[\t\n]+", "", component_string)
+        parts: list[str] = []
+        Printer(parts.append, pretty=False).print_dsl(self)
+        return "".join(parts)
 
     @property
     def components(self) -> list[Component]:
@@ -42,6 +61,103 @@ class DSL:
         """
         return [*self._components.values()]
 
+    @property
+    def digest(self) -> bytes:
+        """
+        The structural digest of the DSL and its components, equal for equal
+        DSL objects; computed on first use, and again after the DSL is modified
+
+        Returns:
+            bytes: The digest of the DSL
+        """
+        if self._digest is None:
+            self._digest = digest(
+                b"dsl",
+                canonical_unordered(
+                    "c", [component.digest for component in self._components.values()]
+                ),
+            )
+        return self._digest
+
+    @property
+    def dirty(self) -> set[Identifier]:
+        """
+        The components modified since they were last validated by validate_incremental
+
+        Returns:
+            set[Identifier]: The identifiers of the modified components
+        """
+        return set(self._dirty)
+
+    def dirty_scope(self) -> dict[Identifier, Optional[dict[Identifier, None]]]:
+        """
+        get what was modified since the journal was last cleared, for the
+        incremental validation: the journal of the DSL, see touch, with the
+        custom layers referencing a component that was added, deleted or whose
+        props changed
+
+        Returns:
+            dict[Identifier, Optional[dict[Identifier, None]]]: The identifiers of the
+            modified components, in order, mapped to None when modified as a whole
+            or to the identifiers of their modified layers, in order
+        """
+        scope = {
+            identifier: None if layers is None else dict(layers)
+            for identifier, layers in self._dirty.items()
+        }
+        for dependency in sorted(self._dirty_dependencies):
+            for component, layer in self._references.get(dependency, {}):
+                if component not in scope:
+                    scope[component] = {layer: None}
+                elif scope[component] is not None:
+                    scope[component][layer] = None
+        return scope
+
+    def clear_dirty(
+        self, kept: Iterable[tuple[Identifier, Optional[Identifier]]] = ()
+    ) -> None:
+        """
+        clears the journal of the DSL, once what it records has been validated
+
+        Args:
+            kept (Iterable[tuple[Identifier, Optional[Identifier]]], optional): The
+            identifiers of the components, and of their layers or None, left in
+            the journal to be validated again. Defaults to ().
+        """
+        self._dirty = {}
+        self._dirty_dependencies = set()
+        for identifier, layer in kept:
+            self._record(identifier, layer=layer)
+
+    def touch(
+        self,
+        identifier: Identifier,
+        layer: Optional[Identifier] = None,
+        dependents: bool = False,
+    ) -> None:
+        """
+        records a modification of a component in the journal of the DSL;
+        Modifications through the methods and setters of DSL, Component and Layer,
+        and in-place modifications of their props and children, are recorded
+        automatically; drops the digests the modification invalidates
+
+        Args:
+            identifier (Identifier): Identifier of the modified Component
+            layer (Optional[Identifier], optional): Identifier of the modified Layer,
+            None when the component is modified as a whole. Defaults to None.
+            dependents (bool, optional): Whether the modification affects the
+            components referencing it; true when it is added or deleted or its
+            props change. Defaults to False.
+        """
+        self._digest = None
+        component = self._components.get(identifier)
+        if component is not None:
+            # pylint: disable=[protected-access]
+            component._digest = None
+            if layer is not None and layer in component._layers:
+                component._layers[layer]._digest = None
+        self._record(identifier, layer=layer, dependents=dependents)
+
     def add_component(self, component: Component) -> None:
         """
         adds a Component to the DSL
@@ -61,6 +177,9 @@ class DSL:
         # pylint: disable=[protected-access]
         component._dsl = self
         self._components[component.identifier] = component
+        for layer in component._layers.values():
+            self._add_reference(layer)
+        self.touch(component.identifier, dependents=True)
 
     def get_component(self, identifier: Identifier) -> Component:
         """
@@ -97,21 +216,102 @@ class DSL:
             )
         component_associated = self._components[identifier]
         # pylint: disable=[protected-access]
+        for layer in component_associated._layers.values():
+            self._remove_reference(layer)
         component_associated._dsl = None
         del self._components[identifier]
+        self.touch(identifier, dependents=True)
+
+    def get_references(self, identifier: Identifier) -> list[Layer]:
+        """
+        get the layers importing a component with the "custom" library
+
+        Args:
+            identifier (Identifier): Identifier of the imported Component,
+            which doesn't have to be in the DSL
+
+        Returns:
+            list[Layer]: The layers of the components of the DSL importing the Component
+        """
+        return [*self._references.get(identifier, {}).values()]
+
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        builds the graph of the references between the components of the DSL
+
+        Returns:
+            DependencyGraph: The graph of the components of the DSL as they are now
+        """
+        return DependencyGraph(self)
+
+    def freeze(self) -> FrozenDSL:
+        """
+        makes an immutable snapshot of the DSL, to be evolved into new snapshots
+        sharing what they don't change, see FrozenDSL
+
+        Returns:
+            FrozenDSL: The snapshot of the DSL as it is now
+        """
+        # frozen builds on this module
+        # pylint: disable=[import-outside-toplevel, cyclic-import]
+        from .frozen import FrozenDSL
 
-    def __stringify(self) -> str:
-        # constants
-        tab = "\t"
-        newline = "\n"
-        open_brace = "{"
-        closed_brace = "}"
-
-        components_string = newline.join(
-            [str(comp) for id, comp in self._components.items()]
-        )
-        components_string = regex_substitute(r"(\n)", r"\1\t", components_string)
-
-        return (
-            f"dsl {open_brace}{newline}{tab}{components_string}{newline}{closed_brace};"
-        )
+        return FrozenDSL.of(self)
+
+    def _record(
+        self,
+        identifier: Identifier,
+        layer: Optional[Identifier] = None,
+        dependents: bool = False,
+    ) -> None:
+        """
+        records a modification of a component in the journal of the DSL,
+        leaving the digests as they are, see touch
+
+        Args:
+            identifier (Identifier): Identifier of the modified Component
+            layer (Optional[Identifier], optional): Identifier of the modified Layer,
+            None when the component is modified as a whole. Defaults to None.
+            dependents (bool, optional): Whether the modification affects the
+            components referencing it. Defaults to False.
+        """
+        if layer is None:
+            self._dirty[identifier] = None
+        elif identifier not in self._dirty:
+            self._dirty[identifier] = {layer: None}
+        elif self._dirty[identifier] is not None:
+            self._dirty[identifier][layer] = None
+        if dependents:
+            self._dirty_dependencies.add(identifier)
+
+    def _add_reference(self, layer: Layer) -> None:
+        """
+        adds a layer of a component of the DSL to the index of custom references,
+        if it imports a custom component
+
+        Args:
+            layer (Layer): The Layer to be indexed
+        """
+        if layer.import_library == "custom" and isinstance(
+            layer.import_name, Identifier
+        ):
+            # pylint: disable=[protected-access]
+            key = (layer._component.identifier, layer.identifier)
+            self._references.setdefault(layer.import_name, {})[key] = layer
+
+    def _remove_reference(self, layer: Layer) -> None:
+        """
+        removes a layer of a component of the DSL from the index of custom references
+
+        Args:
+            layer (Layer): The Layer to be removed from the index
+        """
+        if layer.import_library == "custom" and isinstance(
+            layer.import_name, Identifier
+        ):
+            references = self._references.get(layer.import_name)
+            if references is not None:
+                # pylint: disable=[protected-access]
+                references.pop((layer._component.identifier, layer.identifier), None)
+                if not references:
+                    del self._references[layer.import_name]
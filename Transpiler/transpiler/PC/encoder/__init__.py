@@ -1,8 +1,23 @@
 """The encoder module"""
 
-from .encoder import encode
-from .validator import validate
+from .encoder import encode, encode_to
+from .validator import (
+    collect_violations,
+    collect_violations_incremental,
+    validate,
+    validate_incremental,
+)
+from .violation import Violation
 
 from .errors import StructuralIntegrityError
 
-__all__ = ["encode", "validate", "StructuralIntegrityError"]
+__all__ = [
+    "encode",
+    "encode_to",
+    "validate",
+    "validate_incremental",
+    "collect_violations",
+    "collect_violations_incremental",
+    "Violation",
+    "StructuralIntegrityError",
+]
@@ -1,7 +1,10 @@
 """Encoder for ".pc" DSL"""
 
 
+from typing import TextIO
+
 from ..dsl import DSL  # pragma: no cover
+from ..printer import Printer
 from .validator import validate
 
 
@@ -17,3 +20,19 @@ def encode(dsl: DSL) -> str:
     """
     validate(dsl)
     return repr(dsl)
+
+
+def encode_to(dsl: DSL, stream: TextIO) -> None:
+    """
+    Serializes a DSL object into a text stream, one layer at a time,
+    writing the same text encode returns
+
+    Args:
+        dsl (DSL): The DSL object to be serialized
+        stream (TextIO): The text stream to write to
+
+    Raises:
+        StructuralIntegrityError: If the DSL's structural integrity is not valid
+    """
+    validate(dsl)
+    Printer(stream.write, pretty=False).print_dsl(dsl)
@@ -1,7 +1,7 @@
 """Validator for ".pc" DSL"""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 from ..dsl import DSL
 from ..identifier import Identifier
 from ..prop_reference import PropReference
@@ -9,14 +9,71 @@ from ..prop_reference import PropReference
 from ..errors import IdentifierNotFoundError
 
 from .errors import StructuralIntegrityError
+from .violation import Violation
 
 if TYPE_CHECKING:
     from ..layer import Layer  # pragma: no cover
 
 
+# The code of every check, in the order the checks run in
+codes = (
+    "missing-root-layer",
+    "orphan-non-root-layer",
+    "unknown-parent-layer",
+    "unknown-child-layer",
+    "invalid-import-name",
+    "invalid-import-library",
+    "unknown-custom-component",
+    "mismatching-custom-component-props",
+    "unknown-prop-reference-in-children",
+    "unknown-prop-reference-in-props",
+)
+
+# The messages of the IdentifierNotFoundError the checks raise from, by code
+causes = {
+    "unknown-parent-layer": "There is no matching layer with the provided Identifier in the Component",
+    "unknown-child-layer": "There is no matching layer with the provided Identifier in the Component",
+    "unknown-custom-component": "There is no matching component with the provided Identifier in the DSL",
+}
+
+
 def validate(dsl: DSL) -> None:
     """
     Validate a DSL object for structural integrity;
+    Performs every validate_* check below in a single traversal of the DSL
+
+    Args:
+        dsl (DSL): The DSL object to be validated
+
+    Raises:
+        StructuralIntegrityError: If the DSL's structural integrity is not valid,
+        the error the checks would raise when run one after the other
+    """
+    raise_first_violation(find_violations(dsl, first_only=True))
+
+
+def collect_violations(dsl: DSL) -> list[Violation]:
+    """
+    Collects every violation of the structural integrity of a DSL object,
+    in a single traversal of the DSL
+
+    Args:
+        dsl (DSL): The DSL object to be validated
+
+    Returns:
+        list[Violation]: Every violation ordered by check then by position in the DSL,
+        the first being the one validate raises
+    """
+    return find_violations(dsl)
+
+
+def validate_incremental(dsl: DSL) -> None:
+    """
+    Validate the parts of a DSL object modified since the last call;
+    Re-checks the layers and components in the journal of the DSL, see DSL.touch,
+    and the custom layers referencing a component that was added, deleted or
+    whose props changed, then clears the journal if they are valid.
+    The first call checks every component
 
     Args:
         dsl (DSL): The DSL object to be validated
@@ -24,16 +81,267 @@ def validate(dsl: DSL) -> None:
     Raises:
         StructuralIntegrityError: If the DSL's structural integrity is not valid
     """
-    validate_min_one_root_layer(dsl)
-    validate_no_orphan_non_root_layers(dsl)
-    validate_no_unknown_parent_layers(dsl)
-    validate_no_unknown_child_layers(dsl)
-    validate_identifier_import_name_in_layer(dsl)
-    validate_string_import_library_in_layer(dsl)
-    validate_no_references_to_unknown_custom_component(dsl)
-    validate_no_mismatching_props_in_references_to_custom_component(dsl)
-    validate_no_unknown_prop_reference_in_layer_children(dsl)
-    validate_no_unknown_prop_reference_in_layer_props(dsl)
+    raise_first_violation(
+        find_violations(dsl, first_only=True, scope=dsl.dirty_scope())
+    )
+    dsl.clear_dirty()
+
+
+def collect_violations_incremental(dsl: DSL) -> list[Violation]:
+    """
+    Collects the violations in the parts of a DSL object modified since the
+    last call, as validate_incremental checks them, then clears the journal of
+    what was found valid; what has violations is re-checked by the next call
+
+    Args:
+        dsl (DSL): The DSL object to be validated
+
+    Returns:
+        list[Violation]: Every violation in what was re-checked, ordered by check
+        then by modification
+    """
+    violations = find_violations(dsl, scope=dsl.dirty_scope())
+    dsl.clear_dirty(
+        kept=[(violation.component, violation.layer) for violation in violations]
+    )
+    return violations
+
+
+def raise_first_violation(violations: list[Violation]) -> None:
+    """
+    Raises the StructuralIntegrityError of the first violation, if any
+
+    Args:
+        violations (list[Violation]): The violations ordered as by find_violations
+
+    Raises:
+        StructuralIntegrityError: If there is any violation
+    """
+    if violations:
+        error = StructuralIntegrityError(violations[0].message)
+        if violations[0].code in causes:
+            raise error from IdentifierNotFoundError(causes[violations[0].code])
+        raise error
+
+
+# pylint: disable=[too-many-locals, too-many-branches, too-many-statements]
+def find_violations(
+    dsl: DSL,
+    first_only: bool = False,
+    scope: Optional[dict[Identifier, Optional[dict[Identifier, None]]]] = None,
+) -> list[Violation]:
+    """
+    Finds the violations of every check in a single traversal of the DSL
+
+    Args:
+        dsl (DSL): The DSL object to be validated
+        first_only (bool, optional): Whether to stop looking for violations of a
+        check once one is found, and to stop altogether at the first component
+        without a root layer. Defaults to False.
+        scope (Optional[dict[Identifier, Optional[dict[Identifier, None]]]], optional):
+        The identifiers of the components to check, in order, mapped to None to
+        check all of their layers or to the identifiers of the layers to check,
+        in order; a component is only checked for a root layer with all of its
+        layers. Defaults to every component of the DSL.
+
+    Returns:
+        list[Violation]: The violations ordered by check then by position in the DSL,
+        or in the scope
+    """
+    # The violations of every check, in the order the checks run in
+    found: list[list[Violation]] = [[] for _ in codes]
+
+    # pylint: disable=[protected-access]
+    components_by_identifier = dsl._components
+    if scope is None:
+        scope = dict.fromkeys(components_by_identifier)
+    # Sorted prop names of the custom components referenced so far
+    custom_component_props: dict[Identifier, list[str]] = {}
+
+    for component_identifier, layer_identifiers in scope.items():
+        component = components_by_identifier.get(component_identifier)
+        if component is None:
+            continue
+        layers_by_identifier = component._layers
+        if layer_identifiers is None:
+            layers: Iterable[Layer] = layers_by_identifier.values()
+        else:
+            layers = [
+                layers_by_identifier[identifier]
+                for identifier in layer_identifiers
+                if identifier in layers_by_identifier
+            ]
+        prop_names = {identifier.value for identifier in component.props}
+        # Only a component checked with all of its layers can lack a root layer
+        has_root_layer = layer_identifiers is not None
+
+        for layer in layers:
+            # Parent layer
+            if layer.is_root:
+                has_root_layer = True
+            else:
+                parent = layer.parent
+                if parent is None:
+                    if not (first_only and found[1]):
+                        found[1].append(
+                            Violation(
+                                codes[1],
+                                f"An orphan non-root layer {layer.identifier}"
+                                f" is found in component {component.identifier}",
+                                component.identifier,
+                                layer.identifier,
+                            )
+                        )
+                # An orphan layer has no parent to look up, its violation comes first
+                elif parent not in layers_by_identifier:
+                    if not (first_only and found[2]):
+                        found[2].append(
+                            Violation(
+                                codes[2],
+                                f"The layer {layer.identifier} of component "
+                                f"{component.identifier} has an unknown parent",
+                                component.identifier,
+                                layer.identifier,
+                            )
+                        )
+
+            # Children
+            for child in layer.children:
+                if isinstance(child, Identifier):
+                    if child not in layers_by_identifier and not (
+                        first_only and found[3]
+                    ):
+                        found[3].append(
+                            Violation(
+                                codes[3],
+                                f"The layer {layer.identifier} of component "
+                                f"{component.identifier} has an unknown child layer {child}",
+                                component.identifier,
+                                layer.identifier,
+                            )
+                        )
+                elif isinstance(child, PropReference):
+                    if child.value.value not in prop_names and not (
+                        first_only and found[8]
+                    ):
+                        found[8].append(
+                            Violation(
+                                codes[8],
+                                f"Reference to an unknown prop {child.value} "
+                                f" in children of layer {layer.identifier} "
+                                f"of component {component.identifier}.",
+                                component.identifier,
+                                layer.identifier,
+                            )
+                        )
+
+            # Type
+            if not isinstance(layer.import_name, Identifier) and not (
+                first_only and found[4]
+            ):
+                found[4].append(
+                    Violation(
+                        codes[4],
+                        f"The layer {layer.identifier} of component "
+                        f"{component.identifier} has import name of type other than an Identifier",
+                        component.identifier,
+                        layer.identifier,
+                    )
+                )
+            if not isinstance(layer.import_library, str) and not (
+                first_only and found[5]
+            ):
+                found[5].append(
+                    Violation(
+                        codes[5],
+                        f"The layer {layer.identifier} of component "
+                        f"{component.identifier} has import library of type other than a string",
+                        component.identifier,
+                        layer.identifier,
+                    )
+                )
+            if layer.import_library == "custom":
+                if layer.import_name not in components_by_identifier:
+                    if not (first_only and found[6]):
+                        found[6].append(
+                            Violation(
+                                codes[6],
+                                f"The layer {layer.identifier} of component "
+                                f"{component.identifier} references an unknown component",
+                                component.identifier,
+                                layer.identifier,
+                            )
+                        )
+                # Props can only be compared with those of a known component
+                elif not (first_only and found[7]):
+                    if layer.import_name not in custom_component_props:
+                        custom_component_props[layer.import_name] = sorted(
+                            identifier.value
+                            for identifier in components_by_identifier[
+                                layer.import_name
+                            ].props
+                        )
+                    if sorted(layer.props) != custom_component_props[layer.import_name]:
+                        found[7].append(
+                            Violation(
+                                codes[7],
+                                f"prop mismatch while invoking component {layer.import_name}"
+                                f" in layer {layer.identifier}",
+                                component.identifier,
+                                layer.identifier,
+                            )
+                        )
+
+            # Props
+            if not (first_only and found[9]):
+                for unknown_prop in find_unknown_props_in_obj(layer.props, prop_names):
+                    found[9].append(
+                        Violation(
+                            codes[9],
+                            f"Reference to an unknown prop {unknown_prop} "
+                            f" in children of layer {layer.identifier} "
+                            f"of component {component.identifier}.",
+                            component.identifier,
+                            layer.identifier,
+                        )
+                    )
+                    if first_only:
+                        break
+
+        if not has_root_layer:
+            violation = Violation(
+                codes[0],
+                "Every component in a DSL must contain at least one root layer",
+                component.identifier,
+            )
+            # No other violation can take precedence
+            if first_only:
+                return [violation]
+            found[0].append(violation)
+
+    return [violation for violations in found for violation in violations]
+
+
+def find_unknown_props_in_obj(
+    obj: dict[str, Layer.Value], prop_names: set[str]
+) -> Iterator[PropReference]:
+    """
+    Finds the references to props missing from prop_names in an object,
+    looking into nested objects the way check_for_unknown_prop_in_obj does
+
+    Args:
+        obj (dict[str, Layer.Value]): The object to look into
+        prop_names (set[str]): The names of the props of the component
+
+    Yields:
+        PropReference: The references to unknown props, in order
+    """
+    for value in obj.values():
+        if isinstance(value, PropReference):
+            if value.value.value not in prop_names:
+                yield value
+        elif isinstance(value, dict):
+            yield from find_unknown_props_in_obj(value, prop_names)
 
 
 def validate_min_one_root_layer(dsl: DSL) -> None:
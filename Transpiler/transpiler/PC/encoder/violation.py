@@ -0,0 +1,108 @@
+"""Violation of the structural integrity of a ".pc" DSL"""
+
+from typing import Optional
+
+from ..identifier import Identifier
+
+
+class Violation:
+    """Represents a violation of the structural integrity found by the validator"""
+
+    __slots__ = ("_code", "_message", "_component", "_layer", "_severity")
+
+    # pylint: disable=[too-many-arguments]
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        component: Identifier,
+        layer: Optional[Identifier] = None,
+        severity: str = "error",
+    ) -> None:
+        """
+        Initialise a Violation object
+
+        Args:
+            code (str): The machine-readable code of the violated check
+            message (str): The message of the StructuralIntegrityError raised for it
+            component (Identifier): The identifier of the component it is found in
+            layer (Optional[Identifier], optional): The identifier of the layer
+            it is found in, if any. Defaults to None.
+            severity (str, optional): "error" or "warning". Defaults to "error".
+        """
+        self._code: str = code
+        self._message: str = message
+        self._component: Identifier = component
+        self._layer: Optional[Identifier] = layer
+        self._severity: str = severity
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Violation):
+            return NotImplemented
+        return (
+            self._code == other.code
+            and self._message == other.message
+            and self._component == other.component
+            and self._layer == other.layer
+            and self._severity == other.severity
+        )
+
+    def __str__(self) -> str:
+        return f"{self._severity} {self._code}: {self._message}"
+
+    def __repr__(self) -> str:
+        return (
+            f"Violation({self._code!r}, {self._message!r}, "
+            f"{self._component}, {self._layer}, {self._severity!r})"
+        )
+
+    @property
+    def code(self) -> str:
+        """
+        getter for the _code attribute
+
+        Returns:
+            str: The machine-readable code of the violated check
+        """
+        return self._code
+
+    @property
+    def message(self) -> str:
+        """
+        getter for the _message attribute
+
+        Returns:
+            str: The human-readable description of the violation
+        """
+        return self._message
+
+    @property
+    def component(self) -> Identifier:
+        """
+        getter for the _component attribute
+
+        Returns:
+            Identifier: The identifier of the component the violation is found in
+        """
+        return self._component
+
+    @property
+    def layer(self) -> Optional[Identifier]:
+        """
+        getter for the _layer attribute
+
+        Returns:
+            Optional[Identifier]: The identifier of the layer the violation
+            is found in, None for violations of a whole component
+        """
+        return self._layer
+
+    @property
+    def severity(self) -> str:
+        """
+        getter for the _severity attribute
+
+        Returns:
+            str: "error" or "warning"
+        """
+        return self._severity
@@ -4,10 +4,12 @@ from .invalid_identifier import InvalidIdentifierError
 from .invalid_transaction import InvalidTransactionError
 from .identifier_not_found import IdentifierNotFoundError
 from .duplicate_identifier import DuplicateIdentifierError
+from .cyclic_reference import CyclicReferenceError
 
 __all__ = [
     "InvalidIdentifierError",
     "InvalidTransactionError",
     "IdentifierNotFoundError",
     "DuplicateIdentifierError",
+    "CyclicReferenceError",
 ]
@@ -0,0 +1,27 @@
+"""The CyclicReferenceError module"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..identifier import Identifier  # pragma: no cover
+
+
+class CyclicReferenceError(Exception):
+    """Raised when components reference each other in a cycle"""
+
+    def __init__(self, path: list[Identifier]) -> None:
+        """
+        Initialise a CyclicReferenceError
+
+        Args:
+            path (list[Identifier]): The components of the cycle, starting and
+            ending with the same component
+        """
+        super().__init__(path)
+        self.path: list[Identifier] = path
+
+    def __str__(self) -> str:
+        return "The components reference each other in a cycle: " + " -> ".join(
+            str(identifier) for identifier in self.path
+        )
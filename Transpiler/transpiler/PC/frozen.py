@@ -0,0 +1,596 @@
+"""Immutable snapshots of ".pc" DSL objects"""
+
+from __future__ import annotations
+from typing import Iterable, Optional
+
+from .dsl import DSL
+from .component import Component
+from .layer import Layer
+from .children import Children
+from .identifier import Identifier
+from .persistent_map import PersistentMap
+from .tracked import TrackedDict, TrackedSet
+from .errors import InvalidTransactionError, IdentifierNotFoundError
+
+
+class FrozenLayer(Layer):
+    """
+    An immutable Layer of FrozenComponent objects, shared by every snapshot it
+    is unchanged in; evolve returns a copy with some attributes replaced
+
+    Its props and children are shared as well, and read-only: its children
+    are FrozenChildren, its props a FrozenDict holding FrozenList and
+    FrozenDict values
+    """
+
+    __slots__ = ()
+
+    # The attributes evolve can replace
+    fields = ("is_root", "parent", "children", "props", "import_library", "import_name")
+
+    @classmethod
+    def of(cls, layer: Layer) -> FrozenLayer:
+        """
+        Returns an immutable copy of a Layer, or the Layer if it is immutable
+
+        Args:
+            layer (Layer): The Layer to be copied
+
+        Returns:
+            FrozenLayer: The immutable copy of the Layer
+        """
+        if isinstance(layer, FrozenLayer):
+            return layer
+        # pylint: disable=[protected-access]
+        frozen = cls.__new__(cls)
+        frozen._component = None
+        frozen._identifier = layer._identifier
+        frozen._is_root = layer._is_root
+        frozen._parent = layer._parent
+        frozen._children = copy_children(layer._children)
+        frozen._props = freeze_value(layer._props)
+        frozen._import_library = layer._import_library
+        frozen._import_name = layer._import_name
+        frozen._digest = layer._digest
+        return frozen
+
+    def evolve(self, **changes: object) -> FrozenLayer:
+        """
+        Returns a copy of the layer with some attributes replaced, sharing the others
+
+        The parent and children of other layers aren't updated: the layers
+        linked to the layer have to be evolved as well
+
+        Args:
+            **changes (object): The new values of the attributes, by name,
+            among is_root, parent, children, props, import_library and import_name
+
+        Raises:
+            TypeError: If an attribute can't be replaced
+
+        Returns:
+            FrozenLayer: The new layer
+        """
+        for name in changes:
+            if name not in FrozenLayer.fields:
+                raise TypeError(
+                    f"Unknown layer attribute {name!r}, expected one of {FrozenLayer.fields}"
+                )
+        # pylint: disable=[protected-access]
+        evolved = FrozenLayer.__new__(FrozenLayer)
+        evolved._component = None
+        evolved._identifier = self._identifier
+        evolved._is_root = changes.get("is_root", self._is_root)
+        evolved._parent = changes.get("parent", self._parent)
+        evolved._children = (
+            copy_children(changes["children"])
+            if "children" in changes
+            else self._children
+        )
+        evolved._props = (
+            freeze_value(changes["props"]) if "props" in changes else self._props
+        )
+        evolved._import_library = changes.get("import_library", self._import_library)
+        evolved._import_name = changes.get("import_name", self._import_name)
+        evolved._digest = None
+        return evolved
+
+    @Layer.is_root.setter
+    def is_root(self, value: bool) -> None:
+        """
+        setter for the _is_root attribute
+
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    @Layer.parent.setter
+    def parent(self, identifier: Identifier) -> None:
+        """
+        setter for the _parent attribute
+
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    @Layer.props.setter
+    def props(self, value: dict[str, Layer.Value]) -> None:
+        """
+        setter for the _props attribute
+
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    @Layer.import_library.setter
+    def import_library(self, value: Optional[str]) -> None:
+        """
+        setter for the _import_library attribute
+
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    @Layer.import_name.setter
+    def import_name(self, value: Optional[Identifier]) -> None:
+        """
+        setter for the _import_name attribute
+
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    def delete_parent(self) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    def add_child(self, child: Layer.Child) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    def remove_child(self, child: Layer.Child) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen layer can't be modified
+        """
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+
+class FrozenComponent(Component):
+    """
+    An immutable Component of FrozenDSL objects, shared by every snapshot it
+    is unchanged in; evolve returns a copy with some props or layers replaced,
+    sharing the other layers
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, component: Component) -> FrozenComponent:
+        """
+        Returns an immutable copy of a Component, or the Component if it is immutable
+
+        Args:
+            component (Component): The Component to be copied
+
+        Returns:
+            FrozenComponent: The immutable copy of the Component
+        """
+        if isinstance(component, FrozenComponent):
+            return component
+        # pylint: disable=[protected-access]
+        frozen = cls.__new__(cls)
+        frozen._dsl = None
+        frozen._identifier = component._identifier
+        frozen._props = frozenset(component._props)
+        frozen._layers = PersistentMap(
+            (identifier, FrozenLayer.of(layer))
+            for identifier, layer in component._layers.items()
+        )
+        frozen._digest = component._digest
+        return frozen
+
+    def evolve(
+        self,
+        props: Optional[Iterable[Identifier]] = None,
+        layers: Iterable[Layer] = (),
+        deleted_layers: Iterable[Identifier] = (),
+    ) -> FrozenComponent:
+        """
+        Returns a copy of the component with some props or layers replaced,
+        sharing the others
+
+        Args:
+            props (Optional[Iterable[Identifier]], optional): The new props,
+            None to keep them. Defaults to None.
+            layers (Iterable[Layer], optional): The layers to be added, or to
+            replace the layers with the same identifiers. Defaults to ().
+            deleted_layers (Iterable[Identifier], optional): The identifiers of
+            the layers to be deleted. Defaults to ().
+
+        Raises:
+            IdentifierNotFoundError: If there is no layer to be deleted with
+            one of the provided identifiers
+
+        Returns:
+            FrozenComponent: The new component
+        """
+        # pylint: disable=[protected-access]
+        evolved = FrozenComponent.__new__(FrozenComponent)
+        evolved._dsl = None
+        evolved._identifier = self._identifier
+        evolved._props = self._props if props is None else frozenset(props)
+        evolved._layers = self._layers
+        for layer in layers:
+            evolved._layers = evolved._layers.set(
+                layer.identifier, FrozenLayer.of(layer)
+            )
+        for identifier in deleted_layers:
+            if identifier not in evolved._layers:
+                raise IdentifierNotFoundError(
+                    "There is no matching layer with the provided Identifier in the Component"
+                )
+            evolved._layers = evolved._layers.delete(identifier)
+        evolved._digest = None
+        return evolved
+
+    def add_prop(self, identifier: Identifier) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen component can't be modified
+        """
+        raise InvalidTransactionError("A frozen component can't be modified")
+
+    def delete_prop(self, identifier: Identifier) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen component can't be modified
+        """
+        raise InvalidTransactionError("A frozen component can't be modified")
+
+    def add_layer(self, layer: Layer) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen component can't be modified
+        """
+        raise InvalidTransactionError("A frozen component can't be modified")
+
+    def delete_layer(self, identifier: Identifier) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen component can't be modified
+        """
+        raise InvalidTransactionError("A frozen component can't be modified")
+
+
+class FrozenDSL(DSL):
+    """
+    An immutable snapshot of a DSL object, made by DSL.freeze
+
+    evolve and evolve_layer return new snapshots sharing every unchanged
+    component and layer with this one, so versions of a document cost memory
+    in proportion to their differences. Snapshots can be validated, encoded,
+    compared and printed like DSL objects, and thawed back into DSL objects.
+    A snapshot keeps the journal of the DSL it is made from, and evolve adds
+    the changes it makes to the journal of the new snapshot; validating a
+    snapshot incrementally doesn't clear it
+    """
+
+    # pylint: disable=[super-init-not-called]
+    def __init__(
+        self,
+        components: PersistentMap[Identifier, FrozenComponent],
+        dirty: dict[Identifier, Optional[dict[Identifier, None]]],
+        dirty_dependencies: set[Identifier],
+    ) -> None:
+        """
+        Initialise a FrozenDSL object
+
+        Args:
+            components (PersistentMap[Identifier, FrozenComponent]): The components
+            dirty (dict[Identifier, Optional[dict[Identifier, None]]]): The journal
+            of modifications since the last validate_incremental, see DSL.touch
+            dirty_dependencies (set[Identifier]): The components whose references
+            are affected by the modifications
+        """
+        self._components = components
+        self._dirty = dirty
+        self._dirty_dependencies = dirty_dependencies
+        # The index of custom references of DSL objects, built on first use
+        self._frozen_references: Optional[
+            dict[Identifier, dict[tuple[Identifier, Identifier], Layer]]
+        ] = None
+        self._digest = None
+
+    @classmethod
+    def of(cls, dsl: DSL) -> FrozenDSL:
+        """
+        Returns an immutable snapshot of a DSL object, or the DSL object if it is immutable
+
+        Args:
+            dsl (DSL): The DSL object to be copied
+
+        Returns:
+            FrozenDSL: The immutable snapshot
+        """
+        if isinstance(dsl, FrozenDSL):
+            return dsl
+        # pylint: disable=[protected-access]
+        frozen = cls(
+            PersistentMap(
+                (identifier, FrozenComponent.of(component))
+                for identifier, component in dsl._components.items()
+            ),
+            {
+                identifier: None if layers is None else dict(layers)
+                for identifier, layers in dsl._dirty.items()
+            },
+            set(dsl._dirty_dependencies),
+        )
+        frozen._digest = dsl._digest
+        return frozen
+
+    @property
+    def _references(
+        self,
+    ) -> dict[Identifier, dict[tuple[Identifier, Identifier], Layer]]:
+        if self._frozen_references is None:
+            references: dict[
+                Identifier, dict[tuple[Identifier, Identifier], Layer]
+            ] = {}
+            for component in self._components.values():
+                # pylint: disable=[protected-access]
+                for layer in component._layers.values():
+                    if layer.import_library == "custom" and isinstance(
+                        layer.import_name, Identifier
+                    ):
+                        key = (component.identifier, layer.identifier)
+                        references.setdefault(layer.import_name, {})[key] = layer
+            self._frozen_references = references
+        return self._frozen_references
+
+    def freeze(self) -> FrozenDSL:
+        """
+        Returns the snapshot itself, which is already immutable
+
+        Returns:
+            FrozenDSL: The snapshot
+        """
+        return self
+
+    def thaw(self) -> DSL:
+        """
+        Returns a mutable copy of the snapshot
+
+        Returns:
+            DSL: The mutable copy, with every component to be validated again
+        """
+        dsl = DSL()
+        for frozen_component in self._components.values():
+            component = Component(frozen_component.identifier.value)
+            # pylint: disable=[protected-access]
+            component._props = TrackedSet(frozen_component._props, component)
+            for frozen_layer in frozen_component._layers.values():
+                layer = Layer(frozen_layer.identifier.value)
+                layer._is_root = frozen_layer._is_root
+                layer._parent = frozen_layer._parent
+                layer._children = Children(frozen_layer._children, owner=layer)
+                layer._props = TrackedDict(frozen_layer._props, layer)
+                layer._import_library = frozen_layer._import_library
+                layer._import_name = frozen_layer._import_name
+                component.add_layer(layer)
+            dsl.add_component(component)
+        return dsl
+
+    def evolve(
+        self,
+        components: Iterable[Component] = (),
+        deleted_components: Iterable[Identifier] = (),
+    ) -> FrozenDSL:
+        """
+        Returns a new snapshot with some components replaced, sharing the others
+
+        Args:
+            components (Iterable[Component], optional): The components to be
+            added, or to replace the components with the same identifiers. Defaults to ().
+            deleted_components (Iterable[Identifier], optional): The identifiers
+            of the components to be deleted. Defaults to ().
+
+        Raises:
+            IdentifierNotFoundError: If there is no component to be deleted with
+            one of the provided identifiers
+
+        Returns:
+            FrozenDSL: The new snapshot
+        """
+        evolved = self.__copy()
+        for component in components:
+            evolved._components = evolved._components.set(
+                component.identifier, FrozenComponent.of(component)
+            )
+            evolved._record(component.identifier, dependents=True)
+        for identifier in deleted_components:
+            if identifier not in evolved._components:
+                raise IdentifierNotFoundError(
+                    "There is no matching component with the provided Identifier in the DSL"
+                )
+            evolved._components = evolved._components.delete(identifier)
+            evolved._record(identifier, dependents=True)
+        return evolved
+
+    def evolve_layer(
+        self, component: Identifier, layer: Identifier, **changes: object
+    ) -> FrozenDSL:
+        """
+        Returns a new snapshot with some attributes of a layer replaced, see FrozenLayer.evolve
+
+        Args:
+            component (Identifier): Identifier of the Component of the Layer
+            layer (Identifier): Identifier of the Layer
+            **changes (object): The new values of the attributes, by name
+
+        Raises:
+            IdentifierNotFoundError: If there is no matching component or layer
+            TypeError: If an attribute can't be replaced
+
+        Returns:
+            FrozenDSL: The new snapshot
+        """
+        frozen_component = self.get_component(component)
+        frozen_layer = frozen_component.get_layer(layer).evolve(**changes)
+        evolved = self.__copy()
+        evolved._components = evolved._components.set(
+            component, frozen_component.evolve(layers=[frozen_layer])
+        )
+        evolved._record(component, layer=layer)
+        return evolved
+
+    def touch(
+        self,
+        identifier: Identifier,
+        layer: Optional[Identifier] = None,
+        dependents: bool = False,
+    ) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen DSL can't be modified
+        """
+        raise InvalidTransactionError("A frozen DSL can't be modified")
+
+    def clear_dirty(
+        self, kept: Iterable[tuple[Identifier, Optional[Identifier]]] = ()
+    ) -> None:
+        """
+        Leaves the journal of the snapshot as it is: it is never written to once
+        the snapshot is made, so that validating a snapshot incrementally
+        re-checks what was modified before it was made, every time
+        """
+
+    def add_component(self, component: Component) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen DSL can't be modified
+        """
+        raise InvalidTransactionError("A frozen DSL can't be modified")
+
+    def delete_component(self, identifier: Identifier) -> None:
+        """
+        Raises:
+            InvalidTransactionError: Always, a frozen DSL can't be modified
+        """
+        raise InvalidTransactionError("A frozen DSL can't be modified")
+
+    def __copy(self) -> FrozenDSL:
+        # A snapshot with the same components and a copy of the journal, which
+        # evolve writes to before returning it
+        return FrozenDSL(
+            self._components,
+            {
+                identifier: None if layers is None else dict(layers)
+                for identifier, layers in self._dirty.items()
+            },
+            set(self._dirty_dependencies),
+        )
+
+
+def copy_children(children: Iterable[Layer.Child]) -> FrozenChildren:
+    """
+    Returns a read-only copy of the children of a layer
+
+    Args:
+        children (Iterable[Layer.Child]): The children, in order
+
+    Returns:
+        FrozenChildren: The read-only copy
+    """
+    if isinstance(children, FrozenChildren):
+        return children
+    return FrozenChildren(children)
+
+
+def freeze_value(value: Layer.Value) -> Layer.Value:
+    """
+    Returns a read-only copy of a value of a layer, with every dict and list
+    it holds replaced by a FrozenDict or a FrozenList; the read-only values it
+    holds are shared rather than copied
+
+    Args:
+        value (Layer.Value): The value
+
+    Returns:
+        Layer.Value: The read-only copy
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze_value(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze_value(item) for item in value])
+    return value
+
+
+class FrozenChildren(Children):
+    """
+    The read-only children of a FrozenLayer, shared by every snapshot the
+    layer is in; they are still a list, so they are printed and compared like
+    one. Its methods modifying it raise InvalidTransactionError
+    """
+
+    __slots__ = ()
+
+    def __readonly(self, *args: object, **kwargs: object) -> None:
+        raise InvalidTransactionError("A frozen layer can't be modified")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = __readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = __readonly
+
+
+class FrozenDict(dict):
+    """
+    A read-only dict in the props of a FrozenLayer, shared by every snapshot
+    the layer is in; it is still a dict, so it is printed, compared and
+    encoded like one. Its methods modifying it raise InvalidTransactionError
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple:
+        # Pickled and copied through the constructor, as __setitem__ raises
+        return (FrozenDict, (dict(self),))
+
+    def __readonly(self, *args: object, **kwargs: object) -> None:
+        raise InvalidTransactionError("A frozen value can't be modified")
+
+    __setitem__ = __delitem__ = __ior__ = __readonly
+    clear = pop = popitem = setdefault = update = __readonly
+
+
+class FrozenList(list):
+    """
+    A read-only list in the props of a FrozenLayer, shared by every snapshot
+    the layer is in; it is still a list, so it is printed, compared and
+    encoded like one. Its methods modifying it raise InvalidTransactionError
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple:
+        # Pickled and copied through the constructor, as append raises
+        return (FrozenList, (list(self),))
+
+    def __readonly(self, *args: object, **kwargs: object) -> None:
+        raise InvalidTransactionError("A frozen value can't be modified")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = __readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = __readonly
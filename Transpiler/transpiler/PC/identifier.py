@@ -1,7 +1,10 @@
 """Identifier for ".pc" DSL"""
 
+from __future__ import annotations
+from typing import ClassVar
+from weakref import WeakValueDictionary
 
-from regex import match
+from regex import compile as regex_compile
 
 from .errors import InvalidIdentifierError
 
@@ -9,18 +12,20 @@ from .errors import InvalidIdentifierError
 class Identifier:
     """Represents an Identifier in ".pc" DSL object"""
 
+    __slots__ = ("_value", "__weakref__")
+
     # RegEx for unicode categories
     regex_letter = r"[\p{L}]"
     regex_half_space = r"\u200C"
     regex_zero_width_joiner = r"\u200D"
     regex_non_spacing_mark = r"[\p{Mn}]"
     regex_decimal_digit_number = r"[\p{Nd}]"
-    regex_connector_punctuation = r"[\p{Pc]"
+    regex_connector_punctuation = r"[\p{Pc}]"
 
     regex_backslash = r"\\"
     regex_hex_digit = r"[_0-9a-fA-F]"
     regex_unicode_escape_sequence = (
-        f"{regex_backslash}u{{{regex_hex_digit}{regex_hex_digit}}}|"
+        f"{regex_backslash}u\\{{{regex_hex_digit}{regex_hex_digit}+\\}}|"
         f"{regex_backslash}u{regex_hex_digit}{regex_hex_digit}{regex_hex_digit}{regex_hex_digit}"
     )
 
@@ -36,6 +41,15 @@ class Identifier:
         f"{regex_zero_width_joiner}"
     )
     regex_identifier = f"({regex_identifier_start})({regex_identifier_part})*"
+    pattern_identifier = regex_compile(regex_identifier)
+
+    # Character classes of plain ASCII identifiers
+    ascii_identifier_start = "$_ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    ascii_identifier_part = f"{ascii_identifier_start}0123456789"
+
+    # Interned identifiers by value, see Identifier.of
+    interned_max_size: ClassVar[int] = 65536
+    _interned: ClassVar[WeakValueDictionary[str, Identifier]] = WeakValueDictionary()
 
     def __init__(self, value: str) -> None:
         """
@@ -47,12 +61,60 @@ class Identifier:
         Raises:
         InvalidIdentifierError: If the value provided isn't a valid Identifier
         """
-        if match(self.regex_identifier, value):
+        if self.is_valid(value):
             self._value: str = value
         else:
             raise InvalidIdentifierError()
 
+    @classmethod
+    def of(cls, value: str) -> Identifier:
+        """
+        Returns the shared Identifier for a value, validating each value only
+        once while an Identifier for it is alive. Identifiers are immutable, so
+        sharing them is safe; up to interned_max_size values are interned
+
+        Args:
+        value (str): value of the identifier
+
+        Raises:
+        InvalidIdentifierError: If the value provided isn't a valid Identifier
+
+        Returns:
+            Identifier: The Identifier for the value
+        """
+        identifier = cls._interned.get(value)
+        if identifier is None:
+            identifier = cls(value)
+            if len(cls._interned) < cls.interned_max_size:
+                cls._interned[value] = identifier
+        return identifier
+
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        """
+        Checks whether a value is a valid Identifier, i.e. matches the
+        IDENTIFIER rule of the ".pc" grammar as a whole
+
+        Plain ASCII values are checked against the ASCII character classes,
+        only the others go through the Unicode RegEx
+
+        Args:
+        value (str): value of the identifier
+
+        Returns:
+            bool: whether the value is a valid Identifier
+        """
+        if value.isascii() and "\\" not in value:
+            return (
+                value != ""
+                and value[0] in cls.ascii_identifier_start
+                and not value.strip(cls.ascii_identifier_part)
+            )
+        return cls.pattern_identifier.fullmatch(value) is not None
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Identifier):
             return NotImplemented
         if self._value == other.value:
@@ -66,6 +128,10 @@ class Identifier:
             return True
         return False
 
+    def __reduce__(self) -> tuple:
+        # Unpickled identifiers are interned as well
+        return (Identifier.of, (self._value,))
+
     def __hash__(self) -> int:
         return hash(self._value)
 
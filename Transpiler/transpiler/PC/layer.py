@@ -4,26 +4,34 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, TypeAlias, Optional, Union
 from numbers import Number
 
-from re import sub as regex_substitute
-
 from .identifier import Identifier
 from .prop_reference import PropReference
+from .children import Children
+from .tracked import TrackedDict
+from .digest import digest, canonical_unordered, canonical_value
+from .value_comparator import values_equal, modes
+from .printer import Printer
 from .errors import InvalidTransactionError, IdentifierNotFoundError
 
 if TYPE_CHECKING:
     from .component import Component  # pragma: no cover
+    from .dsl import DSL  # pragma: no cover
 
 
 class Layer:
     """Represents a Layer in ".pc" DSL object"""
 
-    # stringify constants
-    tab = "\t"
-    newline = "\n"
-    open_brace = "{"
-    open_bracket = "["
-    closed_brace = "}"
-    closed_bracket = "]"
+    __slots__ = (
+        "_component",
+        "_identifier",
+        "_is_root",
+        "_parent",
+        "_children",
+        "_props",
+        "_import_library",
+        "_import_name",
+        "_digest",
+    )
 
     # Type definitions
     Value: TypeAlias = Union[
@@ -39,38 +47,68 @@ class Layer:
             name (str): The value of the Identifier for the Layer
         """
         self._component: Optional[Component] = None
-        self._identifier: Identifier = Identifier(name)
+        self._identifier: Identifier = Identifier.of(name)
         self._is_root: bool = False
         self._parent: Optional[Identifier] = None
-        self._children: list[Layer.Child] = []
-        self.props: dict[str, Layer.Value] = {}
-        self.import_library: Optional[str] = None
-        self.import_name: Optional[Identifier] = None
+        self._children: Children = Children(owner=self)
+        self._props: dict[str, Layer.Value] = TrackedDict(owner=self)
+        self._import_library: Optional[str] = None
+        self._import_name: Optional[Identifier] = None
+        self._digest: Optional[bytes] = None
 
     def __eq__(self, other: Layer) -> bool:
+        return self.equals(other)
+
+    def __str__(self) -> str:
+        parts: list[str] = []
+        Printer(parts.append, pretty=True).print_layer(self)
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        parts: list[str] = []
+        Printer(parts.append, pretty=False).print_layer(self)
+        return "".join(parts)
+
+    def equals(self, other: Layer, mode: str = "legacy") -> bool:
+        """
+        compares the layer with another one; children are compared whatever
+        their order, props with values_equal in the provided mode
+
+        Args:
+            other (Layer): The layer to compare with
+            mode (str, optional): "legacy", where lists in props are compared
+            whatever the order of their items, as == does, or "strict".
+            Defaults to "legacy".
+
+        Raises:
+            ValueError: If the mode isn't one of the supported modes
+
+        Returns:
+            bool: whether the layers are equal
+        """
+        if mode not in modes:
+            raise ValueError(
+                f"Unknown comparison mode {mode!r}, expected one of {modes}"
+            )
+        # Layers equal in either mode are equal in the legacy mode the digest follows
+        if self.digest != other.digest:
+            return False
         if self._identifier != other._identifier:
             return False
         if self._is_root != other._is_root:
             return False
-        if self.import_name != other.import_name:
+        if self._import_name != other.import_name:
             return False
-        if self.import_library != other.import_library:
+        if self._import_library != other.import_library:
             return False
         if self._parent != other._parent:
             return False
-        if set(self._children) != set(other._children):
+        if self._children.distinct() != other._children.distinct():
             return False
-        if not self.__check_eq_props(other):
+        if not values_equal(self._props, other.props, mode):
             return False
         return True
 
-    def __str__(self) -> str:
-        return self.__stringify()
-
-    def __repr__(self) -> str:
-        layer_string = self.__stringify()
-        return regex_substitute(r"[\t\n]+", "", layer_string)
-
     @property
     def identifier(self) -> Identifier:
         """
@@ -81,6 +119,30 @@ class Layer:
         """
         return self._identifier
 
+    @property
+    def digest(self) -> bytes:
+        """
+        The structural digest of the layer, equal for equal layers;
+        computed on first use, and again after the layer is modified
+
+        Returns:
+            bytes: The digest of the layer
+        """
+        if self._digest is None:
+            self._digest = digest(
+                b"layer",
+                canonical_value(self._identifier),
+                b"root" if self._is_root else b"",
+                canonical_value(self._import_library),
+                canonical_value(self._import_name),
+                canonical_value(self._parent),
+                canonical_unordered(
+                    "c", [canonical_value(child) for child in self._children.distinct()]
+                ),
+                canonical_value(self._props),
+            )
+        return self._digest
+
     @property
     def is_root(self) -> bool:
         """
@@ -107,6 +169,8 @@ class Layer:
                 "A layer with an parent can't be a root layer"
             )
         self._is_root = value
+        # The component may be left without a root layer
+        self._touch(whole_component=True)
 
     @property
     def parent(self) -> Optional[Identifier]:
@@ -161,6 +225,7 @@ class Layer:
             ) from exc
 
         self._parent = identifier
+        self._touch()
 
     def delete_parent(self) -> None:
         """
@@ -171,6 +236,7 @@ class Layer:
             # pylint: disable=[protected-access]
             parent_layer._children.remove(self._identifier)
             self._parent = None
+            self._touch()
 
     @property
     def children(self) -> list[Layer.Child]:
@@ -178,7 +244,8 @@ class Layer:
         getter for the _children attribute
 
         Returns:
-            list[Layer.Child]: list of children associated with the layer
+            list[Layer.Child]: children associated with the layer, in order;
+            add_child and remove_child keep the parent of child layers in sync
         """
         return self._children
 
@@ -225,6 +292,7 @@ class Layer:
                     )
                 # pylint: disable=[protected-access]
                 child_layer._parent = self._identifier
+                self._touch(child_layer)
             except IdentifierNotFoundError as exc:
                 raise IdentifierNotFoundError(
                     "There is no layer with the provided identifier in the component"
@@ -254,111 +322,107 @@ class Layer:
             child_layer = self._component.get_layer(child)
             # pylint: disable=[protected-access]
             child_layer._parent = None
+            self._touch(child_layer)
 
-    def __stringify(self) -> str:
-        return (
-            # header
-            f'layer {"root " if self._is_root else ""}'
-            f"{self._identifier} {Layer.open_brace}{Layer.newline}"
-            # type statement
-            f'{Layer.tab}type "{self.import_library}" {self.import_name};{Layer.newline}'
-            # props statement
-            f"{Layer.tab}props {self.__stringify_value_dict(dictionary=self.props)};{Layer.newline}"
-            # parent statement
-            f'{Layer.tab}parent {self._parent if self._parent is not None else "null"};'
-            f"{Layer.newline}"
-            # children statement
-            f"{Layer.tab}children {self.__stringify_layer_child_array(children=self._children)};"
-            f"{Layer.newline}"
-            # footer
-            f"{Layer.closed_brace};"
-        )
-
-    def __stringify_value_dict(self, dictionary: dict[str, Layer.Value]) -> str:
-        # dict stringified
-        dict_string: str = ""
-        pair_strings: list[str] = []
-        for key in dictionary:
-            pair_strings.append(f'"{key}" = {self.__stringify_value(dictionary[key])}')
-        if len(pair_strings) > 0:
-            dict_string = (
-                f"{Layer.newline}{Layer.tab}"
-                + f",{Layer.newline}{Layer.tab}".join(pair_strings)
-                + f",{Layer.newline}"
-            )
-            dict_string = regex_substitute(r"(\t+)", r"\1\t", dict_string)
-            dict_string = dict_string + "\t"
-        return f"{Layer.open_brace}{dict_string}{Layer.closed_brace}"
-
-    def __stringify_value_array(self, arr: list[Layer.Value]) -> str:
-        # list stringified
-        arr_string: str = ""
-        item_strings: list[str] = []
-        for item in arr:
-            item_strings.append(self.__stringify_value(item))
-        if len(item_strings) > 0:
-            arr_string = (
-                f"{Layer.newline}{Layer.tab}"
-                + f",{Layer.newline}{Layer.tab}".join(item_strings)
-                + f",{Layer.newline}"
-            )
-            arr_string = regex_substitute(r"(\t+)", r"\1\t", arr_string)
-        return f"{Layer.open_bracket}{arr_string}{Layer.tab}{Layer.closed_bracket}"
-
-    def __stringify_value(self, val: Layer.Value) -> str:
-        if isinstance(val, bool):
-            return str(val).lower()
-        if isinstance(val, str):
-            return f'"{val}"'
-        if isinstance(val, Number):
-            return str(val)
-        if isinstance(val, PropReference):
-            return str(val)
-        if isinstance(val, dict):
-            return self.__stringify_value_dict(val)
-        if isinstance(val, list):
-            return self.__stringify_value_array(val)
-        return "null"
-
-    def __stringify_layer_child_array(self, children: list[Layer.Child]) -> str:
-        # children stringified
-        children_string: str = ""
-        children_strings: list[str] = []
-        for child in children:
-            if isinstance(child, str):
-                children_strings.append(f'"{child}"')
-            else:
-                children_strings.append(str(child))
-        if len(children_strings) > 0:
-            children_string = (
-                f"{Layer.newline}{Layer.tab}{Layer.tab}"
-                + f",{Layer.newline}{Layer.tab}{Layer.tab}".join(children_strings)
-                + f",{Layer.newline}{Layer.tab}"
-            )
-        return f"{Layer.open_bracket}{children_string}{Layer.closed_bracket}"
+    @property
+    def props(self) -> dict[str, Layer.Value]:
+        """
+        getter for the _props attribute
 
-    def __check_eq_props(self, other: Layer) -> bool:
-        return self.__check_eq_dict(self.props, other.props)
+        Returns:
+            dict[str, Layer.Value]: The props passed to the imported component;
+            their in-place modifications are recorded as modifications of the layer
+        """
+        return self._props
 
-    def __check_eq_dict(self, a: dict[str, Value], b: dict[str, Value]) -> bool:
-        if len(a) != len(b):
-            return False
-        for key in a:
-            if key not in b:
-                return False
-            else:
-                if isinstance(a[key], dict):
-                    if not isinstance(b[key], dict):
-                        return False
-                    if not self.__check_eq_dict(a[key], b[key]):
-                        return False
-                elif isinstance(a[key], list):
-                    if not isinstance(b[key], list):
-                        return False
-                    for item in a[key]:
-                        if item not in b[key]:
-                            return False
-                else:
-                    if a[key] != b[key]:
-                        return False
-        return True
+    @props.setter
+    def props(self, value: dict[str, Layer.Value]) -> None:
+        """
+        setter for the _props attribute
+
+        Args:
+            value (dict[str, Layer.Value]): The props passed to the imported component,
+            copied into a TrackedDict
+        """
+        self._props = TrackedDict(value, self)
+        self._touch()
+
+    @property
+    def import_library(self) -> Optional[str]:
+        """
+        getter for the _import_library attribute
+
+        Returns:
+            Optional[str]: The library the component of the layer is imported from
+        """
+        return self._import_library
+
+    @import_library.setter
+    def import_library(self, value: Optional[str]) -> None:
+        """
+        setter for the _import_library attribute
+
+        Args:
+            value (Optional[str]): The library the component of the layer is imported from
+        """
+        dsl = self.__dsl()
+        if dsl is not None:
+            # pylint: disable=[protected-access]
+            dsl._remove_reference(self)
+        self._import_library = value
+        if dsl is not None:
+            dsl._add_reference(self)
+        self._touch()
+
+    @property
+    def import_name(self) -> Optional[Identifier]:
+        """
+        getter for the _import_name attribute
+
+        Returns:
+            Optional[Identifier]: The name of the imported component
+        """
+        return self._import_name
+
+    @import_name.setter
+    def import_name(self, value: Optional[Identifier]) -> None:
+        """
+        setter for the _import_name attribute
+
+        Args:
+            value (Optional[Identifier]): The name of the imported component
+        """
+        dsl = self.__dsl()
+        if dsl is not None:
+            # pylint: disable=[protected-access]
+            dsl._remove_reference(self)
+        self._import_name = value
+        if dsl is not None:
+            dsl._add_reference(self)
+        self._touch()
+
+    def __dsl(self) -> Optional[DSL]:
+        # The DSL of the component of the layer, if any
+        if self._component is None:
+            return None
+        # pylint: disable=[protected-access]
+        return self._component._dsl
+
+    def _touch(
+        self, layer: Optional[Layer] = None, whole_component: bool = False
+    ) -> None:
+        """
+        records a modification of the layer, or of another layer of its
+        component: drops the digests it invalidates, and records it in the
+        journal of the DSL, for validate_incremental
+
+        Args:
+            layer (Optional[Layer], optional): The modified Layer. Defaults to this layer.
+            whole_component (bool, optional): Whether the modification affects
+            the component as a whole. Defaults to False.
+        """
+        layer = self if layer is None else layer
+        # pylint: disable=[protected-access]
+        layer._digest = None
+        if self._component is not None:
+            self._component._touch(None if whole_component else layer.identifier)
@@ -0,0 +1,176 @@
+"""Persistent map of the snapshots of ".pc" DSL objects"""
+
+from __future__ import annotations
+from collections.abc import Mapping
+from heapq import merge
+from typing import Generic, Hashable, Iterable, Iterator, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class PersistentMap(Mapping, Generic[K, V]):
+    """
+    An immutable mapping in insertion order, like a dict, whose set and delete
+    return a new map sharing most of its storage with the map they are called on
+
+    The entries are spread over about the square root of their number of
+    buckets, so set and delete copy that many entries and bucket references
+    rather than the whole map
+    """
+
+    __slots__ = ("_buckets", "_length", "_next_position")
+
+    def __init__(self, items: Iterable[tuple[K, V]] = ()) -> None:
+        """
+        Initialise a PersistentMap object
+
+        Args:
+            items (Iterable[tuple[K, V]], optional): The entries, in order; a key
+            given more than once keeps its first position and its last value, as
+            in a dict. Defaults to ().
+        """
+        entries = dict(items)
+        self._length: int = len(entries)
+        self._next_position: int = len(entries)
+        self._buckets: tuple[dict[K, tuple[int, V]], ...] = PersistentMap.__distribute(
+            (
+                (key, (position, value))
+                for position, (key, value) in enumerate(entries.items())
+            ),
+            len(entries),
+        )
+
+    def __getitem__(self, key: K) -> V:
+        return self._buckets[hash(key) & (len(self._buckets) - 1)][key][1]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._buckets[hash(key) & (len(self._buckets) - 1)]
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self.__entries():
+            yield key
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if isinstance(other, PersistentMap) and other._buckets is self._buckets:
+            return True
+        for key, (_, value) in self.__entries():
+            if key not in other or other[key] != value:
+                return False
+        return True
+
+    def __reduce__(self) -> tuple:
+        # Buckets depend on the hashes of the keys, which differ between processes
+        return (PersistentMap, (self.items(),))
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({self.items()!r})"
+
+    def items(self) -> list[tuple[K, V]]:  # type: ignore[override]
+        """
+        The entries of the map
+
+        Returns:
+            list[tuple[K, V]]: The keys and values, in insertion order
+        """
+        return [(key, value) for key, (_, value) in self.__entries()]
+
+    def values(self) -> list[V]:  # type: ignore[override]
+        """
+        The values of the map
+
+        Returns:
+            list[V]: The values, in insertion order
+        """
+        return [value for _, (_, value) in self.__entries()]
+
+    def set(self, key: K, value: V) -> PersistentMap[K, V]:
+        """
+        maps a key to a value, in a new map; a key already present keeps its position
+
+        Args:
+            key (K): The key
+            value (V): The value
+
+        Returns:
+            PersistentMap[K, V]: The new map, sharing the other entries with this one
+        """
+        index = hash(key) & (len(self._buckets) - 1)
+        bucket = dict(self._buckets[index])
+        entry = bucket.get(key)
+        if entry is None:
+            bucket[key] = (self._next_position, value)
+            return self.__replace(
+                index, bucket, self._length + 1, self._next_position + 1
+            )
+        bucket[key] = (entry[0], value)
+        return self.__replace(index, bucket, self._length, self._next_position)
+
+    def delete(self, key: K) -> PersistentMap[K, V]:
+        """
+        removes a key, in a new map
+
+        Args:
+            key (K): The key
+
+        Raises:
+            KeyError: If the key isn't present
+
+        Returns:
+            PersistentMap[K, V]: The new map, sharing the other entries with this one
+        """
+        index = hash(key) & (len(self._buckets) - 1)
+        bucket = dict(self._buckets[index])
+        del bucket[key]
+        return self.__replace(index, bucket, self._length - 1, self._next_position)
+
+    def __entries(self) -> Iterator[tuple[K, tuple[int, V]]]:
+        # The entries of every bucket are in the order of their positions
+        if len(self._buckets) == 1:
+            return iter(self._buckets[0].items())
+        return merge(
+            *(bucket.items() for bucket in self._buckets), key=lambda entry: entry[1][0]
+        )
+
+    def __replace(
+        self,
+        index: int,
+        bucket: dict[K, tuple[int, V]],
+        length: int,
+        next_position: int,
+    ) -> PersistentMap[K, V]:
+        result: PersistentMap[K, V] = PersistentMap.__new__(PersistentMap)
+        result._length = length
+        result._next_position = next_position
+        buckets = [*self._buckets]
+        buckets[index] = bucket
+        if length > 2 * len(buckets) ** 2:
+            # Spread the entries over more buckets, as the map grows
+            ordered = sorted(
+                (entry for entries in buckets for entry in entries.items()),
+                key=lambda entry: entry[1][0],
+            )
+            result._buckets = PersistentMap.__distribute(ordered, length)
+        else:
+            result._buckets = tuple(buckets)
+        return result
+
+    @staticmethod
+    def __distribute(
+        entries: Iterable[tuple[K, tuple[int, V]]], length: int
+    ) -> tuple[dict[K, tuple[int, V]], ...]:
+        # A power of two of buckets, about the square root of the number of entries
+        count = 1
+        while count * count < length:
+            count *= 2
+        buckets: list[dict[K, tuple[int, V]]] = [{} for _ in range(count)]
+        for key, entry in entries:
+            buckets[hash(key) & (count - 1)][key] = entry
+        return tuple(buckets)
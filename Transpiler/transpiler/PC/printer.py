@@ -0,0 +1,221 @@
+"""Printer for ".pc" DSL"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable
+from numbers import Number
+
+from .prop_reference import PropReference
+
+if TYPE_CHECKING:
+    from .dsl import DSL  # pragma: no cover
+    from .component import Component  # pragma: no cover
+    from .layer import Layer  # pragma: no cover
+
+
+class Printer:
+    """
+    Writes DSL, Component and Layer objects as ".pc" text in a single walk
+
+    The pretty text is the one of str(), every line indented with tabs, and the
+    compact text the one of repr(), the pretty text without any tab or newline.
+    Text is written one layer at a time, with the indentation kept as state
+    """
+
+    # constants
+    tab = "\t"
+    newline = "\n"
+
+    def __init__(
+        self, write: Callable[[str], object], pretty: bool = True, indent: int = 0
+    ) -> None:
+        """
+        Initialise a Printer object
+
+        Args:
+            write (Callable[[str], object]): The function the text is written with,
+            like the write method of a text stream
+            pretty (bool, optional): Whether to write the pretty text rather than
+            the compact text. Defaults to True.
+            indent (int, optional): The number of tabs every line after the first
+            is indented with. Defaults to 0.
+        """
+        self._write: Callable[[str], object] = write
+        self._pretty: bool = pretty
+        self._indent: int = indent
+        self._parts: list[str] = []
+
+    def print_dsl(self, dsl: DSL) -> None:
+        """
+        writes a DSL object
+
+        Args:
+            dsl (DSL): The DSL object to be written
+        """
+        self._parts.append("dsl {")
+        self._indent += 1
+        for component in dsl.components:
+            self.__newline(0)
+            self.__print_component(component)
+        self._indent -= 1
+        if self._pretty and not dsl.components:
+            self.__newline(1)
+        self.__newline(0)
+        self._parts.append("};")
+        self.__flush()
+
+    def print_component(self, component: Component) -> None:
+        """
+        writes a Component object
+
+        Args:
+            component (Component): The Component object to be written
+        """
+        self.__print_component(component)
+        self.__flush()
+
+    def print_layer(self, layer: Layer) -> None:
+        """
+        writes a Layer object
+
+        Args:
+            layer (Layer): The Layer object to be written
+        """
+        self.__print_layer(layer)
+        self.__flush()
+
+    def __print_component(self, component: Component) -> None:
+        props = ", ".join(identifier.value for identifier in sorted(component.props))
+        self._parts.append(f"component {component.identifier.value}({props}) {{")
+        self._indent += 1
+        layers = component.layers
+        for layer in layers:
+            self.__newline(0)
+            self.__print_layer(layer)
+            # Keep at most one layer of text in memory
+            self.__flush()
+        self._indent -= 1
+        if self._pretty and not layers:
+            self.__newline(1)
+        self.__newline(0)
+        self._parts.append("};")
+
+    def __print_layer(self, layer: Layer) -> None:
+        parts = self._parts
+        parent = layer.parent
+        parts.append(f'layer {"root " if layer.is_root else ""}{layer.identifier} {{')
+        self.__newline(1)
+        parts.append(
+            f'type "{self.__text(str(layer.import_library), 0)}" '
+            f"{self.__text(str(layer.import_name), 0)};"
+        )
+        self.__newline(1)
+        parts.append("props ")
+        self.__print_dict(layer.props, 1)
+        parts.append(";")
+        self.__newline(1)
+        parts.append(
+            f'parent {self.__text(str(parent), 0) if parent is not None else "null"};'
+        )
+        self.__newline(1)
+        parts.append("children ")
+        self.__print_children(layer.children)
+        parts.append(";")
+        self.__newline(0)
+        parts.append("};")
+
+    def __print_dict(self, dictionary: dict[str, Layer.Value], depth: int) -> None:
+        # depth is the indentation of the line the object opens on, within the layer
+        parts = self._parts
+        parts.append("{")
+        if dictionary:
+            for key, value in dictionary.items():
+                self.__newline(depth + 1)
+                parts.append(f'"{self.__text(str(key), depth)}" = ')
+                self.__print_value(value, depth + 1)
+                parts.append(",")
+            self.__newline(depth)
+        parts.append("}")
+
+    def __print_array(self, arr: list[Layer.Value], depth: int) -> None:
+        parts = self._parts
+        parts.append("[")
+        if arr:
+            for item in arr:
+                self.__newline(depth + 1)
+                self.__print_value(item, depth + 1)
+                parts.append(",")
+            self.__newline(depth)
+        elif self._pretty:
+            # An empty array keeps the indentation of its closing bracket
+            parts.append(Printer.tab * depth)
+        parts.append("]")
+
+    def __print_value(self, val: Layer.Value, depth: int) -> None:
+        if isinstance(val, bool):
+            self._parts.append(str(val).lower())
+        elif isinstance(val, str):
+            self._parts.append(f'"{self.__text(val, depth - 1)}"')
+        elif isinstance(val, Number):
+            self._parts.append(self.__text(str(val), depth - 1))
+        elif isinstance(val, PropReference):
+            self._parts.append(str(val))
+        elif isinstance(val, dict):
+            self.__print_dict(val, depth)
+        elif isinstance(val, list):
+            self.__print_array(val, depth)
+        else:
+            self._parts.append("null")
+
+    def __print_children(self, children: list[Layer.Child]) -> None:
+        parts = self._parts
+        parts.append("[")
+        if children:
+            for child in children:
+                self.__newline(2)
+                if isinstance(child, str):
+                    parts.append(f'"{self.__text(child, 0)}"')
+                else:
+                    parts.append(self.__text(str(child), 0))
+                parts.append(",")
+            self.__newline(1)
+        parts.append("]")
+
+    def __newline(self, depth: int) -> None:
+        # A line break followed by the indentation of the enclosing objects and
+        # depth more tabs, nothing in the compact text
+        if self._pretty:
+            self._parts.append(Printer.newline + Printer.tab * (self._indent + depth))
+
+    def __text(self, text: str, nesting: int) -> str:
+        # Text written as is: strings, keys, and values printed with str().
+        # The compact text drops its tabs and newlines; the pretty text has
+        # every run of tabs lengthened by the number of enclosing objects and
+        # arrays, and every newline followed by the indentation of the
+        # enclosing components and DSL, as if the text were indented with it
+        if "\t" not in text and "\n" not in text:
+            return text
+        if not self._pretty:
+            return text.replace("\t", "").replace("\n", "")
+        if nesting > 0 and "\t" in text:
+            extra_tabs = Printer.tab * nesting
+            characters: list[str] = []
+            in_run = False
+            for character in text:
+                if character == "\t":
+                    if not in_run:
+                        characters.append(extra_tabs)
+                    in_run = True
+                else:
+                    in_run = False
+                characters.append(character)
+            text = "".join(characters)
+        if self._indent > 0:
+            text = text.replace(
+                Printer.newline, Printer.newline + Printer.tab * self._indent
+            )
+        return text
+
+    def __flush(self) -> None:
+        if self._parts:
+            self._write("".join(self._parts))
+            self._parts = []
@@ -7,6 +7,8 @@ from .identifier import Identifier
 class PropReference:
     """Represents a PropReference in ".pc" DSL object"""
 
+    __slots__ = ("_value",)
+
     def __init__(self, identifier: Identifier) -> None:
         """Initialises a PropReference with a given Identifier"""
 
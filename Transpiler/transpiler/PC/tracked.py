@@ -0,0 +1,280 @@
+"""Props of ".pc" DSL objects that record their in-place modifications"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Optional, SupportsIndex, Union
+
+if TYPE_CHECKING:
+    from .component import Component  # pragma: no cover
+    from .identifier import Identifier  # pragma: no cover
+    from .layer import Layer  # pragma: no cover
+
+
+def track_value(value: Layer.Value, owner: Optional[Layer]) -> Layer.Value:
+    """
+    Returns a copy of a value of the props of a layer, with every dict and list
+    it holds replaced by a TrackedDict or a TrackedList recording its
+    modifications for the layer
+
+    Args:
+        value (Layer.Value): The value
+        owner (Optional[Layer]): The layer the modifications are recorded for
+
+    Returns:
+        Layer.Value: The tracked copy
+    """
+    if isinstance(value, dict):
+        return TrackedDict(value, owner)
+    if isinstance(value, list):
+        return TrackedList(value, owner)
+    return value
+
+
+class TrackedDict(dict):
+    """
+    A dict in the props of a Layer; its methods modifying it record the
+    modification of the layer, see DSL.touch, and track the dicts and lists
+    added to it. It is still a dict, so it is printed, compared and encoded
+    like one
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self, items: Union[dict, Iterable] = (), owner: Optional[Layer] = None
+    ) -> None:
+        """
+        Initialise a TrackedDict object, tracking the values it holds
+
+        Args:
+            items (Union[dict, Iterable], optional): The items. Defaults to ().
+            owner (Optional[Layer], optional): The layer the modifications are
+            recorded for. Defaults to None.
+        """
+        super().__init__()
+        self._owner: Optional[Layer] = owner
+        for key, item in dict(items).items():
+            super().__setitem__(key, track_value(item, owner))
+
+    def __reduce__(self) -> tuple:
+        # Pickled and copied through the constructor, as __setitem__ records
+        return (TrackedDict, (dict(self), self._owner))
+
+    def __setitem__(self, key: str, value: Layer.Value) -> None:
+        super().__setitem__(key, track_value(value, self._owner))
+        self.__touch()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.__touch()
+
+    def __ior__(self, other: Union[dict, Iterable]) -> TrackedDict:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.__touch()
+
+    def pop(self, *args: object) -> Layer.Value:
+        value = super().pop(*args)
+        self.__touch()
+        return value
+
+    def popitem(self) -> tuple[str, Layer.Value]:
+        item = super().popitem()
+        self.__touch()
+        return item
+
+    def setdefault(self, key: str, default: Layer.Value = None) -> Layer.Value:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: object, **kwargs: Layer.Value) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(key, track_value(value, self._owner))
+        self.__touch()
+
+    def __touch(self) -> None:
+        if self._owner is not None:
+            # pylint: disable=[protected-access]
+            self._owner._touch()
+
+
+class TrackedList(list):
+    """
+    A list in the props of a Layer; its methods modifying it record the
+    modification of the layer, see DSL.touch, and track the dicts and lists
+    added to it. It is still a list, so it is printed, compared and encoded
+    like one
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self, items: Iterable[Layer.Value] = (), owner: Optional[Layer] = None
+    ) -> None:
+        """
+        Initialise a TrackedList object, tracking the values it holds
+
+        Args:
+            items (Iterable[Layer.Value], optional): The items. Defaults to ().
+            owner (Optional[Layer], optional): The layer the modifications are
+            recorded for. Defaults to None.
+        """
+        super().__init__(track_value(item, owner) for item in items)
+        self._owner: Optional[Layer] = owner
+
+    def __reduce__(self) -> tuple:
+        # Pickled and copied through the constructor, as append records
+        return (TrackedList, (list(self), self._owner))
+
+    def __setitem__(
+        self,
+        index: Union[SupportsIndex, slice],
+        value: Union[Layer.Value, Iterable[Layer.Value]],
+    ) -> None:
+        if isinstance(index, slice):
+            value = [track_value(item, self._owner) for item in value]
+        else:
+            value = track_value(value, self._owner)
+        super().__setitem__(index, value)
+        self.__touch()
+
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        super().__delitem__(index)
+        self.__touch()
+
+    def __iadd__(self, items: Iterable[Layer.Value]) -> TrackedList:
+        self.extend(items)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> TrackedList:
+        super().__imul__(count)
+        self.__touch()
+        return self
+
+    def append(self, item: Layer.Value) -> None:
+        super().append(track_value(item, self._owner))
+        self.__touch()
+
+    def extend(self, items: Iterable[Layer.Value]) -> None:
+        super().extend([track_value(item, self._owner) for item in items])
+        self.__touch()
+
+    def insert(self, index: SupportsIndex, item: Layer.Value) -> None:
+        super().insert(index, track_value(item, self._owner))
+        self.__touch()
+
+    def pop(self, index: SupportsIndex = -1) -> Layer.Value:
+        item = super().pop(index)
+        self.__touch()
+        return item
+
+    def remove(self, item: Layer.Value) -> None:
+        super().remove(item)
+        self.__touch()
+
+    def clear(self) -> None:
+        super().clear()
+        self.__touch()
+
+    def sort(self, *args: object, **kwargs: object) -> None:
+        super().sort(*args, **kwargs)
+        self.__touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__touch()
+
+    def __touch(self) -> None:
+        if self._owner is not None:
+            # pylint: disable=[protected-access]
+            self._owner._touch()
+
+
+class TrackedSet(set):
+    """
+    The props of a Component; its methods modifying it record the
+    modification of the component and of the components referencing it,
+    see DSL.touch. It is still a set, so it is printed, compared and encoded
+    like one
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self, items: Iterable[Identifier] = (), owner: Optional[Component] = None
+    ) -> None:
+        """
+        Initialise a TrackedSet object
+
+        Args:
+            items (Iterable[Identifier], optional): The props. Defaults to ().
+            owner (Optional[Component], optional): The component the
+            modifications are recorded for. Defaults to None.
+        """
+        super().__init__(items)
+        self._owner: Optional[Component] = owner
+
+    def __reduce__(self) -> tuple:
+        # Pickled and copied through the constructor, as add records
+        return (TrackedSet, (set(self), self._owner))
+
+    def __ior__(self, other: Iterable[Identifier]) -> TrackedSet:
+        self.update(other)
+        return self
+
+    def __iand__(self, other: Iterable[Identifier]) -> TrackedSet:
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other: Iterable[Identifier]) -> TrackedSet:
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other: Iterable[Identifier]) -> TrackedSet:
+        self.symmetric_difference_update(other)
+        return self
+
+    def add(self, identifier: Identifier) -> None:
+        super().add(identifier)
+        self.__touch()
+
+    def discard(self, identifier: Identifier) -> None:
+        super().discard(identifier)
+        self.__touch()
+
+    def remove(self, identifier: Identifier) -> None:
+        super().remove(identifier)
+        self.__touch()
+
+    def pop(self) -> Identifier:
+        identifier = super().pop()
+        self.__touch()
+        return identifier
+
+    def clear(self) -> None:
+        super().clear()
+        self.__touch()
+
+    def update(self, *others: Iterable[Identifier]) -> None:
+        super().update(*others)
+        self.__touch()
+
+    def difference_update(self, *others: Iterable[Identifier]) -> None:
+        super().difference_update(*others)
+        self.__touch()
+
+    def intersection_update(self, *others: Iterable[Identifier]) -> None:
+        super().intersection_update(*others)
+        self.__touch()
+
+    def symmetric_difference_update(self, other: Iterable[Identifier]) -> None:
+        super().symmetric_difference_update(other)
+        self.__touch()
+
+    def __touch(self) -> None:
+        if self._owner is not None:
+            # pylint: disable=[protected-access]
+            self._owner._touch(dependents=True)
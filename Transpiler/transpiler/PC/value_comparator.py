@@ -0,0 +1,62 @@
+"""Comparator of the values of layers in ".pc" DSL"""
+
+from __future__ import annotations
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from .digest import canonical_value
+
+if TYPE_CHECKING:
+    from .layer import Layer  # pragma: no cover
+
+
+# The modes of values_equal
+modes = ("legacy", "strict")
+
+
+def values_equal(a: Layer.Value, b: Layer.Value, mode: str = "legacy") -> bool:
+    """
+    Compares two values of layers in a single walk of both
+
+    Dicts are equal when they have the same keys with equal values. In "strict"
+    mode lists are equal when they have equal items in the same order; in
+    "legacy" mode, the one of Layer.__eq__, when they have equal items the same
+    number of times, in any order. Lists are compared in linear time, by
+    counting the canonical forms of their items
+
+    Args:
+        a (Layer.Value): The first value
+        b (Layer.Value): The second value
+        mode (str, optional): "legacy" or "strict". Defaults to "legacy".
+
+    Raises:
+        ValueError: If the mode isn't one of the supported modes
+
+    Returns:
+        bool: whether the values are equal
+    """
+    if mode not in modes:
+        raise ValueError(f"Unknown comparison mode {mode!r}, expected one of {modes}")
+    return _values_equal(a, b, mode == "strict")
+
+
+def _values_equal(a: Layer.Value, b: Layer.Value, ordered: bool) -> bool:
+    if isinstance(a, dict):
+        if not isinstance(b, dict) or len(a) != len(b):
+            return False
+        for key, item in a.items():
+            if key not in b or not _values_equal(item, b[key], ordered):
+                return False
+        return True
+    if isinstance(a, list):
+        if not isinstance(b, list) or len(a) != len(b):
+            return False
+        if ordered:
+            for item, other in zip(a, b):
+                if not _values_equal(item, other, ordered):
+                    return False
+            return True
+        return Counter(map(canonical_value, a)) == Counter(map(canonical_value, b))
+    if isinstance(b, (dict, list)):
+        return False
+    return a == b
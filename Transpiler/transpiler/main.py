@@ -1,22 +1,37 @@
 from typing import Union, Dict, Any
+import asyncio
 import importlib
+import json
 import sys
 
 from fastapi import FastAPI, Body, HTTPException
+from fastapi.responses import StreamingResponse
 
 import uvicorn
 import os
 
 from Dsl import Dsl
 
-from PC.decoder.decode import decode
-from PC.dsl import DSL
+from PC.decoder.errors import DecodeError
 
-from visitors import Visitor
+from workers import TranspilePool, PoolSaturatedError, diagnose, transpile
 
 app = FastAPI()
 
 
+@app.on_event("startup")
+async def start_transpile_pool():
+    """Starts the worker processes decoding and transpiling DSL strings"""
+    app.state.transpile_pool = TranspilePool.from_environment()
+    await app.state.transpile_pool.start()
+
+
+@app.on_event("shutdown")
+def stop_transpile_pool():
+    """Stops the worker processes"""
+    app.state.transpile_pool.shutdown()
+
+
 @app.get("/")
 def health_check():
     """_summary_
@@ -31,18 +46,105 @@ def health_check():
     "/transpile",
 )
 async def dsl_transpile(body: Dict = Body(...)):
-    # try:
-    dsl_instance: DSL = decode(body["dsl"])
-    visiter = Visitor(dsl_instance)
+    # Decode and transpile in a worker process, keeping the event loop free
+    try:
+        code = await app.state.transpile_pool.run(transpile, body["dsl"])
+    except DecodeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except PoolSaturatedError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail="The server is busy transpiling, retry later",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except asyncio.TimeoutError as exc:
+        raise HTTPException(
+            status_code=504, detail="Transpiling the DSL took too long"
+        ) from exc
+
+    return {"response": code}
+
+
+@app.post(
+    "/validate",
+)
+async def dsl_validate(body: Dict = Body(...)):
+    # Report every violation at once, so that they can be fixed in a single edit
+    try:
+        violations = await app.state.transpile_pool.run(diagnose, body["dsl"])
+    except DecodeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except PoolSaturatedError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail="The server is busy transpiling, retry later",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except asyncio.TimeoutError as exc:
+        raise HTTPException(
+            status_code=504, detail="Validating the DSL took too long"
+        ) from exc
+
+    return {"violations": violations}
 
-    print(visiter.walk())
 
-    return {"response": "dsl_instance"}
+@app.post(
+    "/transpile/batch",
+)
+async def dsl_transpile_batch(body: Dict = Body(...)):
+    # Fan the DSL strings out across the worker processes
+    results = await app.state.transpile_pool.run_many(transpile, body["dsls"])
+
+    responses = []
+    for result in results:
+        # gather returns the CancelledError of a cancelled item too
+        if isinstance(result, BaseException):
+            responses.append({"error": describe_error(result)})
+        else:
+            responses.append({"response": result})
+    return {"responses": responses}
+
 
-    # except Exception as exc:
+@app.post(
+    "/transpile/batch/stream",
+)
+async def dsl_transpile_batch_stream(body: Dict = Body(...)):
+    # Stream the components of every DSL as NDJSON lines as soon as the DSL is
+    # transpiled; a DSL is transpiled at once, so the lines come per DSL
+    async def lines():
+        results = app.state.transpile_pool.run_as_completed(transpile, body["dsls"])
+        try:
+            async for index, result in results:
+                if isinstance(result, Exception):
+                    yield json.dumps(
+                        {"index": index, "error": describe_error(result)}
+                    ) + "\n"
+                    continue
+                for component, code in result.items():
+                    yield json.dumps(
+                        {"index": index, "component": component, "code": code}
+                    ) + "\n"
+        finally:
+            # Cancels the DSLs in flight when the client disconnects
+            await results.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def describe_error(exc: BaseException) -> str:
+    """Describes why transpiling a DSL of a batch failed
+
+    Args:
+        exc (BaseException): The exception raised
 
-    #     print(exc)
-    #     raise HTTPException(status_code=400, detail="Error creating item")
+    Returns:
+        str: The error message
+    """
+    if isinstance(exc, PoolSaturatedError):
+        return "The server is busy transpiling, retry later"
+    if isinstance(exc, asyncio.TimeoutError):
+        return "Transpiling the DSL took too long"
+    return f"{type(exc).__name__}: {exc}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,274 @@
+import asyncio
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from PC.decoder import DecodeCache, warmup, snapshot_loaded, startup_time
+from PC.dsl import DSL
+from PC.encoder import collect_violations
+
+from visitors import Visitor
+
+# Decode cache of the worker process
+decode_cache: Optional[DecodeCache] = None
+
+# The decoder backend of every task: the descent backend rejects the syntax
+# errors the ANTLR one recovers from, which would transpile or validate a
+# broken document as if it were fine
+backend = "descent"
+
+
+class PoolSaturatedError(Exception):
+    """Raised when the pool already has as many requests as it can queue"""
+
+
+def initialize_worker(cache_max_entries: int, cache_max_bytes: int) -> None:
+    """Warms up the decoder of a worker process and creates its decode cache
+
+    Args:
+        cache_max_entries (int): maximum number of cached DSL objects
+        cache_max_bytes (int): maximum total size of the cached DSL objects
+    """
+    global decode_cache
+    decode_cache = DecodeCache(max_entries=cache_max_entries, max_bytes=cache_max_bytes)
+    lexer_states, parser_states = warmup()
+    print(
+        f"Worker {os.getpid()}: decoder started in {startup_time:.3f}s "
+        f"({'with' if snapshot_loaded else 'without'} DFA snapshot), "
+        f"warmed up with {lexer_states} lexer and {parser_states} parser DFA states"
+    )
+
+
+def transpile(dsl: str) -> Dict[str, str]:
+    """Decodes a DSL string and generates the code of its components
+
+    Args:
+        dsl (str): The DSL string
+
+    Raises:
+        DecodeError: If the DSL string isn't a valid document
+
+    Returns:
+        Dict[str, str]: The generated code by component identifier
+    """
+    dsl_instance: DSL = decode_cache.decode(dsl, backend=backend)
+    visiter = Visitor(dsl_instance)
+    code = visiter.walk()
+    return {str(identifier): source for identifier, source in code.items()}
+
+
+def diagnose(dsl: str) -> List[Dict[str, Optional[str]]]:
+    """Decodes a DSL string and collects every violation of its structural integrity
+
+    Args:
+        dsl (str): The DSL string
+
+    Raises:
+        DecodeError: If the DSL string isn't a valid document
+
+    Returns:
+        List[Dict[str, Optional[str]]]: The code, severity, message, component
+        and layer of every violation
+    """
+    dsl_instance: DSL = decode_cache.decode(dsl, backend=backend)
+    return [
+        {
+            "code": violation.code,
+            "severity": violation.severity,
+            "message": violation.message,
+            "component": str(violation.component),
+            "layer": None if violation.layer is None else str(violation.layer),
+        }
+        for violation in collect_violations(dsl_instance)
+    ]
+
+
+def ping() -> int:
+    """A no-op task used to start the worker processes
+
+    Returns:
+        int: The process id of the worker
+    """
+    return os.getpid()
+
+
+class TranspilePool:
+    """Runs CPU-bound tasks in worker processes, off the event loop
+
+    At most `workers + queue_size` tasks are in flight at once, further
+    submissions are rejected with PoolSaturatedError. Tasks that time out
+    keep counting until their worker is done with them. The items of every
+    batch share `workers` slots of the pool, waiting for one to be free, so
+    that concurrent batches can't saturate the pool between them.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        timeout: float,
+        cache_max_entries: int,
+        cache_max_bytes: int,
+    ) -> None:
+        self.workers: int = workers
+        self.capacity: int = workers + queue_size
+        self.timeout: float = timeout
+        self._in_flight: int = 0
+        self._lock: Lock = Lock()
+        self._batch_slots: asyncio.Semaphore = asyncio.Semaphore(workers)
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialize_worker,
+            initargs=(cache_max_entries, cache_max_bytes),
+        )
+
+    @classmethod
+    def from_environment(cls) -> "TranspilePool":
+        """Creates a pool configured by the TRANSPILE_* and DECODE_CACHE_* environment variables
+
+        Returns:
+            TranspilePool: The configured pool
+        """
+        workers = int(os.environ.get("TRANSPILE_WORKERS", os.cpu_count() or 1))
+        return cls(
+            workers=workers,
+            queue_size=int(os.environ.get("TRANSPILE_QUEUE_SIZE", 4 * workers)),
+            timeout=float(os.environ.get("TRANSPILE_TIMEOUT", 30)),
+            cache_max_entries=int(os.environ.get("DECODE_CACHE_MAX_ENTRIES", 256)),
+            cache_max_bytes=int(
+                os.environ.get("DECODE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+            ),
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """The number of submitted tasks the workers aren't done with
+
+        Returns:
+            int: The number of running and queued tasks
+        """
+        return self._in_flight
+
+    async def start(self) -> None:
+        """Starts every worker process, running their initializer"""
+        await asyncio.gather(
+            *[
+                asyncio.wrap_future(self._executor.submit(ping))
+                for _ in range(self.workers)
+            ]
+        )
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Runs a function in a worker process
+
+        Args:
+            function (Callable[..., Any]): A picklable function
+            *args (Any): Its picklable arguments
+
+        Raises:
+            PoolSaturatedError: If the pool is saturated
+            asyncio.TimeoutError: If the function didn't complete within the timeout
+
+        Returns:
+            Any: The value returned by the function
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise PoolSaturatedError("The transpile pool is saturated")
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self.__release(None)
+            raise
+        future.add_done_callback(self.__release)
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+
+    async def run_many(
+        self, function: Callable[[Any], Any], items: Iterable[Any]
+    ) -> List[Union[Any, BaseException]]:
+        """Runs a function on every item in worker processes, in the slots
+        of the pool shared by batches
+
+        Args:
+            function (Callable[[Any], Any]): A picklable function
+            items (Iterable[Any]): Its picklable arguments
+
+        Returns:
+            List[Union[Any, BaseException]]: The value returned, or the exception
+            raised, for every item in order
+        """
+        return await asyncio.gather(
+            *[self.__run_batched(function, item) for item in items],
+            return_exceptions=True,
+        )
+
+    async def run_as_completed(
+        self, function: Callable[[Any], Any], items: Iterable[Any]
+    ) -> AsyncIterator[Tuple[int, Union[Any, Exception]]]:
+        """Runs a function on every item in worker processes, yielding results
+        as they complete. Items are consumed lazily, with at most as many
+        items in flight as there are workers, so finished results never pile up.
+        The tasks still in flight are cancelled when the iterator is closed
+
+        Args:
+            function (Callable[[Any], Any]): A picklable function
+            items (Iterable[Any]): Its picklable arguments
+
+        Yields:
+            Tuple[int, Union[Any, Exception]]: The index of an item and the value
+            returned, or the exception raised, for it
+        """
+
+        async def run_item(index: int, item: Any) -> Tuple[int, Union[Any, Exception]]:
+            try:
+                return index, await self.__run_batched(function, item)
+            except Exception as exc:  # pylint: disable=[broad-except]
+                return index, exc
+
+        pending: Set[asyncio.Task] = set()
+        try:
+            for index, item in enumerate(items):
+                if len(pending) >= self.workers:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(run_item(index, item)))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # The consumer stopped early, e.g. the client disconnected
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, cancelling the queued tasks"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __run_batched(self, function: Callable[[Any], Any], item: Any) -> Any:
+        # Waits for one of the slots shared by the items of every batch
+        async with self._batch_slots:
+            return await self.run(function, item)
+
+    def __release(self, _: Optional[Future]) -> None:
+        with self._lock:
+            self._in_flight -= 1